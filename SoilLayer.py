@@ -1,10 +1,20 @@
 import pygame
+import numpy as np
 from constants import *
-from support import import_folder
+from assets import assets
 from random import choice
 from sprites import SoilWaterTile  # Import the new class
 from SoilTile import SoilTile
 from Plant import Plant
+from crops import CropField, CROP_TYPES
+from tile_bitmap import TileBitmap
+from spatial_hash import moved
+
+# Soil grid flags, one byte per tile
+TILLED = 1
+WATERED = 2
+PLANTED = 4
+RIPE = 8  # Planted and harvestable
 
 class SoilLayer:
     def __init__(self, all_sprites, collision_sprites):
@@ -15,135 +25,203 @@ class SoilLayer:
         self.water_sprites = pygame.sprite.Group()
         self.plant_sprites = pygame.sprite.Group()
 
+        # (col, row) -> sprite, so every tile operation is a lookup
+        self.soil_tiles = {}
+        self.water_tiles = {}
+        self.plants = {}
+        self.crops = CropField()  # Growth state of every plant, grown in one batch
+
         # Graphics
-        self.soil_surfs = import_folder('graphics/soil')
-        self.water_surfs = import_folder('graphics/soil_water')
+        self.soil_surfs = assets.frames('graphics/soil')
+        self.water_surfs = assets.frames('graphics/soil_water')
 
         # Sound
         try:
-            self.hoe_sound = pygame.mixer.Sound('graphics/hoe.wav')
+            self.hoe_sound = assets.sound('graphics/hoe.wav')
             self.hoe_sound.set_volume(0.1)
         except:
             print("Hoe sound not found")
 
         self.create_soil_grid()
-        self.create_hit_rects()
+        # Hoeable tiles; nothing until Level.setup reads the map's Farmable layer
+        self.farmable = TileBitmap(self.grid.shape[1], self.grid.shape[0])
 
         # Weather
         self.raining = False
         self.water_all()
 
     def create_soil_grid(self):
-        ground = pygame.image.load("graphics/world/ground.png")
+        ground = assets.surface('graphics/world/ground.png')  # Shared with the level
         h_tiles = ground.get_width() // TILE_SIZE
         v_tiles = ground.get_height() // TILE_SIZE
 
-        self.grid = []
-        for row in range(v_tiles):
-            self.grid.append([[] for col in range(h_tiles)])
+        self.grid = np.zeros((v_tiles, h_tiles), dtype=np.uint8)  # [row, col] -> flags
+
+    def tile_at(self, point):
+        """(col, row) of the tile under a world-space point."""
+        return int(point[0]) // TILE_SIZE, int(point[1]) // TILE_SIZE
 
-    def create_hit_rects(self):
-        """Create rectangles for soil collision detection."""
-        self.hit_rects = []
-        for row_index, row in enumerate(self.grid):
-            for col_index, cell in enumerate(row):
-                x = col_index * TILE_SIZE
-                y = row_index * TILE_SIZE
-                rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                self.hit_rects.append(rect)
+    def on_grid(self, x, y):
+        """True if (col, row) lies inside the soil grid (negative indices would wrap)."""
+        rows, cols = self.grid.shape
+        return 0 <= x < cols and 0 <= y < rows
 
     def get_hit(self, point):
-        """Handle soil being hit with hoe."""
-        for rect in self.hit_rects:
-            if rect.collidepoint(point):
-                self.hoe_sound.play()
-                
-                x = rect.x // TILE_SIZE
-                y = rect.y // TILE_SIZE
-
-                if 'F' not in self.grid[y][x]:
-                    self.grid[y][x].append('F')
-                    
-                    # Create soil tile
-                    surf = choice(self.soil_surfs)
-                    SoilTile(
-                        pos=(rect.x, rect.y),
-                        surf=surf,
-                        groups=[self.all_sprites, self.soil_sprites]
-                    )
+        """Handle soil being hit with hoe. Only farmable tiles can be hoed."""
+        if not self.farmable.value_at(point):
+            return
+        self.hoe_sound.play()
+
+        x, y = self.tile_at(point)
+        if self.on_grid(x, y) and not self.grid[y, x] & TILLED:
+            self.grid[y, x] |= TILLED
+            self.add_soil_sprite(x, y)
+
+    def add_soil_sprite(self, x, y):
+        surf = choice(self.soil_surfs)
+        self.soil_tiles[(x, y)] = SoilTile(
+            pos=(x * TILE_SIZE, y * TILE_SIZE),
+            surf=surf,
+            groups=[self.all_sprites, self.soil_sprites]
+        )
+
+    def add_water_sprite(self, x, y):
+        self.water_tiles[(x, y)] = SoilWaterTile(  # Use the new class
+            pos=(x * TILE_SIZE, y * TILE_SIZE),
+            surf=choice(self.water_surfs),
+            groups=[self.all_sprites, self.water_sprites]
+        )
 
     def water(self, target_pos):
         """Water the soil at target position."""
-        for soil_sprite in self.soil_sprites.sprites():
-            if soil_sprite.rect.collidepoint(target_pos):
-                
-                # Add water to grid
-                x = soil_sprite.rect.x // TILE_SIZE
-                y = soil_sprite.rect.y // TILE_SIZE
-                self.grid[y][x].append('W')
-
-                # Create soil water tile
-                SoilWaterTile(  # Use the new class
-                    pos=soil_sprite.rect.topleft,
-                    surf=choice(self.water_surfs),
-                    groups=[self.all_sprites, self.water_sprites]
-                )
+        x, y = self.tile_at(target_pos)
+        if self.on_grid(x, y) and self.grid[y, x] & (TILLED | WATERED) == TILLED:
+            self.grid[y, x] |= WATERED
+            self.add_water_sprite(x, y)
 
     def water_all(self):
-        """Water all farmable soil."""
-        for row_index, row in enumerate(self.grid):
-            for col_index, cell in enumerate(row):
-                if 'F' in cell and 'W' not in cell:
-                    cell.append('W')
-                    x = col_index * TILE_SIZE
-                    y = row_index * TILE_SIZE
-                    SoilWaterTile(  # Use the new class
-                        pos=(x, y),
-                        surf=choice(self.water_surfs),
-                        groups=[self.all_sprites, self.water_sprites]
-                    )
+        """Water all tilled soil."""
+        dry = self.grid & (TILLED | WATERED) == TILLED
+        self.grid[dry] |= WATERED
+        # Only the newly watered tiles need a sprite
+        for y, x in np.argwhere(dry):
+            self.add_water_sprite(int(x), int(y))
 
     def remove_water(self):
         """Remove all water."""
-        # Kill water sprites
-        for sprite in self.water_sprites.sprites():
+        self.grid &= ~np.uint8(WATERED)
+        for sprite in self.water_tiles.values():
             sprite.kill()
-            
-        # Remove water from grid
-        for row in self.grid:
-            for cell in row:
-                if 'W' in cell:
-                    cell.remove('W')
+        self.water_tiles.clear()
 
     def check_watered(self, pos):
         """Check if position is watered."""
-        x = pos[0] // TILE_SIZE
-        y = pos[1] // TILE_SIZE
-        cell = self.grid[y][x]
-        is_watered = 'W' in cell
-        return is_watered
+        x, y = self.tile_at(pos)
+        return self.on_grid(x, y) and bool(self.grid[y, x] & WATERED)
+
+    def count(self, flag):
+        """Number of tiles with flag set, e.g. count(PLANTED)."""
+        return int(np.count_nonzero(self.grid & flag))
+
+    def harvestable_tiles(self):
+        """(col, row) of every tile with a ripe plant."""
+        return [(int(x), int(y)) for y, x in np.argwhere(self.grid & RIPE)]
 
     def plant_seed(self, target_pos, seed):
         """Plant a seed at target position."""
-        for soil_sprite in self.soil_sprites.sprites():
-            if soil_sprite.rect.collidepoint(target_pos):
-                x = soil_sprite.rect.x // TILE_SIZE
-                y = soil_sprite.rect.y // TILE_SIZE
-
-                if 'P' not in self.grid[y][x]:
-                    self.grid[y][x].append('P')
-                    Plant(
-                        plant_type=seed,
-                        groups=[self.all_sprites, self.plant_sprites, self.collision_sprites],
-                        soil=soil_sprite,
-                        check_watered=self.check_watered
-                    )
+        x, y = self.tile_at(target_pos)
+        soil_sprite = self.soil_tiles.get((x, y))
+        if soil_sprite and not self.grid[y, x] & PLANTED:
+            self.grid[y, x] |= PLANTED
+            self.add_plant(x, y, seed)
+            return True
+        return False
+
+    def add_plant(self, x, y, seed):
+        plant = self.plants[(x, y)] = Plant(
+            plant_type=seed,
+            groups=[self.all_sprites, self.plant_sprites, self.collision_sprites],
+            soil=self.soil_tiles[(x, y)],
+            crops=self.crops
+        )
+        return plant
+
+    def plants_in(self, rect):
+        """Plants whose rect overlaps a world-space rect."""
+        # A plant can reach up out of its own tile, so also look one row further down
+        left = rect.left // TILE_SIZE
+        top = rect.top // TILE_SIZE
+        right = (rect.right - 1) // TILE_SIZE
+        bottom = (rect.bottom - 1) // TILE_SIZE + 1
+        found = []
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                plant = self.plants.get((x, y))
+                if plant and plant.rect.colliderect(rect):
+                    found.append(plant)
+        return found
+
+    def remove_plant(self, plant):
+        """Take a plant out of the field (e.g. once harvested)."""
+        x, y = self.tile_at(plant.soil.rect.topleft)
+        self.plants.pop((x, y), None)
+        self.grid[y, x] &= ~np.uint8(PLANTED | RIPE)
+        plant.kill()
+
+    def plants_grown(self, changed):
+        """Show new growth stages and mark ripe tiles after a batch step."""
+        # Only plants that reached a new stage have a new image and rect
+        for plant in changed:
+            plant.show_stage(self.crops.stage(plant.slot))
+            moved(plant)
+        cols, rows = self.crops.harvestable_tiles()
+        self.grid[rows, cols] |= RIPE
 
     def update_plants(self):
-        """Update all plants."""
-        for plant in self.plant_sprites.sprites():
-            plant.grow()
+        """Grow every watered plant by one day."""
+        self.plants_grown(self.crops.grow(self.grid & WATERED != 0))
 
     def maxAgeAllPlants(self):
-        for plant in self.plant_sprites.sprites():
-            plant.setAgetoMax()
+        self.plants_grown(self.crops.ripen(self.grid & WATERED != 0))
+
+    def catch_up(self, days, rainy):
+        """Advance the farm by whole days at once, as if Level.reset ran days times.
+
+        rainy[d] is whether it rains after rollover d. A plant grows on the
+        first rollover if its tile is watered now, and on every later one
+        that follows a rainy day; the soil ends up watered only if it rains
+        after the last rollover. Cost does not depend on days.
+        """
+        if days <= 0:
+            return
+        rainy = np.asarray(rainy[:days], dtype=bool)
+        watered = self.crops.watered(self.grid & WATERED != 0)
+        days_grown = watered.astype(np.int64) + int(np.count_nonzero(rainy[:-1]))
+        self.plants_grown(self.crops.advance(days_grown))
+
+        self.remove_water()
+        self.raining = bool(rainy[-1])
+        if self.raining:
+            self.water_all()
+
+    def restore(self, grid, crops):
+        """Rebuild the field from saved flags and crop columns (see savegame)."""
+        for y, x in np.argwhere(grid & TILLED):
+            self.add_soil_sprite(int(x), int(y))
+        self.grid[:] = grid & ~np.uint8(RIPE)
+        for y, x in np.argwhere(grid & WATERED):
+            self.add_water_sprite(int(x), int(y))
+
+        ages = []
+        for kind, age, grow_speed, col, row in zip(crops['kind'], crops['age'], crops['grow_speed'],
+                                                   crops['col'], crops['row']):
+            plant = self.add_plant(int(col), int(row), CROP_TYPES[kind])
+            self.crops.grow_speed[plant.slot] = grow_speed
+            ages.append((plant.slot, age))
+
+        # Grow the new plants straight to their saved ages
+        new_age = self.crops.age[:len(self.crops)].copy()
+        for slot, age in ages:
+            new_age[slot] = age
+        everyone = np.ones(len(self.crops), dtype=bool)
+        self.plants_grown(self.crops.step(everyone, new_age))
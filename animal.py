@@ -3,9 +3,10 @@ from random import randint
 from constants import LAYERS, TILE_SIZE
 
 class Animal(pygame.sprite.Sprite):
-    def __init__(self, animal_type, start_pos, groups, collision_sprites):
+    def __init__(self, animal_type, start_pos, groups, collision_sprites, collision_tiles):
         super().__init__(groups)
         self.collision_sprites = collision_sprites
+        self.collision_tiles = collision_tiles
         self.animal_type = animal_type
 
         # Load animal image
@@ -46,8 +47,6 @@ class Animal(pygame.sprite.Sprite):
         self.rect.topleft = (int(self.pos.x), int(self.pos.y))
 
         # Handle collisions
-        for sprite in self.collision_sprites:
-            if sprite.rect.colliderect(self.rect):
-                self.pos -= self.direction * self.speed * dt
-                self.rect.topleft = (int(self.pos.x), int(self.pos.y))
-                break  # Exit the loop after collision is handled
+        if self.collision_tiles.blocks(self.rect) or self.collision_sprites.query(self.rect):
+            self.pos -= self.direction * self.speed * dt
+            self.rect.topleft = (int(self.pos.x), int(self.pos.y))
@@ -0,0 +1,40 @@
+class Animation:
+    """A looping frame sequence shared by every sprite that shows it."""
+
+    def __init__(self, frames, speed):
+        self.frames = frames
+        self.speed = speed  # Frames per second
+        self.frame_index = 0
+
+    @property
+    def index(self):
+        return int(self.frame_index)
+
+    @property
+    def image(self):
+        return self.frames[int(self.frame_index)]
+
+    def advance(self, dt):
+        self.frame_index += self.speed * dt
+        if self.frame_index >= len(self.frames):
+            self.frame_index = 0
+
+class AnimationClock:
+    """Advances each shared frame sequence once per tick."""
+
+    def __init__(self):
+        self.animations = {}
+
+    def get(self, frames, speed=5):
+        """Return the shared animation for a frame list, creating it on first use."""
+        key = (id(frames), speed)
+        if key not in self.animations:
+            self.animations[key] = Animation(frames, speed)
+        return self.animations[key]
+
+    def update(self, dt):
+        for animation in self.animations.values():
+            animation.advance(dt)
+
+# Clock used by the level's looping tile animations
+animation_clock = AnimationClock()
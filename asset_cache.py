@@ -0,0 +1,112 @@
+"""On-disk cache of decoded images and sounds.
+
+Decoded pixels (RGBA) and mixer samples are written next to a small header
+holding the source file's mtime, size and SHA-1. Warm starts map the cache
+file and hand the buffer straight to pygame instead of decoding PNG/MP3
+again. An entry is rebuilt automatically when its source changes.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import pygame
+
+CACHE_DIR = os.path.join('.cache', 'assets')
+
+MAGIC = b'BHAC'
+VERSION = 1
+IMAGE, SOUND = 0, 1
+
+# magic, version, kind, source mtime (ns), source size, source sha1, then
+# width/height/0 for images or frequency/sample size/channels for sounds
+HEADER = struct.Struct('<4sBBqq20siii')
+
+def file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+def cache_path(path, kind):
+    name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}.{'rgba' if kind == IMAGE else 'pcm'}")
+
+def read_entry(path, kind, params=None):
+    """Map the cache entry for path, or return None if it is missing or stale."""
+    entry = cache_path(path, kind)
+    try:
+        stat = os.stat(path)
+        with open(entry, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(data) < HEADER.size:
+        data.close()
+        return None
+    magic, version, entry_kind, mtime, size, sha1, a, b, c = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or entry_kind != kind or (params and (a, b, c) != params):
+        data.close()
+        return None
+
+    # Fast path is the stat; only hash the source when its timestamp moved
+    if (mtime, size) != (stat.st_mtime_ns, stat.st_size) and sha1 != file_sha1(path):
+        data.close()
+        return None
+    return data, (a, b, c)
+
+def write_entry(path, kind, params, payload):
+    """Write a cache entry atomically. Failures (e.g. read-only dir) are ignored."""
+    try:
+        stat = os.stat(path)
+        header = HEADER.pack(MAGIC, VERSION, kind, stat.st_mtime_ns, stat.st_size, file_sha1(path), *params)
+        entry = cache_path(path, kind)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp = f'{entry}.{os.getpid()}.{id(payload)}.tmp'
+        with open(temp, 'wb') as file:
+            file.write(header)
+            file.write(payload)
+        os.replace(temp, entry)
+    except OSError:
+        pass
+
+def load_image(path):
+    """Decode an image (unconverted, RGBA), using the cache when it is current."""
+    entry = read_entry(path, IMAGE)
+    if entry is not None:
+        data, (width, height, _) = entry
+        pixels = memoryview(data)[HEADER.size:]
+        # One copy straight out of the mapping, so the file can be closed right away
+        view = pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+        surf = view.copy()
+        del view
+        pixels.release()
+        data.close()
+        return surf
+
+    surf = pygame.image.load(path)
+    write_entry(path, IMAGE, (surf.get_width(), surf.get_height(), 0), pygame.image.tobytes(surf, 'RGBA'))
+    return surf
+
+def load_sound(path):
+    """Decode a sound into mixer samples, using the cache when it matches the mixer format."""
+    mixer = pygame.mixer.get_init()
+    entry = read_entry(path, SOUND, mixer)
+    if entry is not None:
+        data, _ = entry
+        samples = memoryview(data)[HEADER.size:]
+        sound = pygame.mixer.Sound(buffer=samples)  # Copies the samples
+        samples.release()
+        data.close()
+        return sound
+
+    sound = pygame.mixer.Sound(path)
+    write_entry(path, SOUND, mixer, sound.get_raw())
+    return sound
+
+def clear():
+    """Delete every cache entry."""
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            os.remove(os.path.join(CACHE_DIR, name))
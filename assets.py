@@ -0,0 +1,121 @@
+import pygame
+from support import import_folder
+from atlas import ATLAS_INDEX, load_atlas, folder_images
+from asset_cache import load_image, load_sound
+
+class AssetRegistry:
+    """Process-wide cache of surfaces, frame lists and sounds.
+
+    Each path is loaded once and the same object is handed to every caller,
+    so callers must treat what they get back as read-only.
+    """
+
+    def __init__(self):
+        self.assets = {}  # (kind, path) -> surface, tuple of surfaces or sound
+        self.sizes = {}  # (kind, path) -> bytes held
+        self.atlas = None  # Packed atlas, loaded on first frame lookup
+        self.atlas_checked = False
+
+    @staticmethod
+    def surface_bytes(surf):
+        return surf.get_pitch() * surf.get_height()
+
+    @staticmethod
+    def sound_bytes(sound):
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return 0
+        frequency, size, channels = mixer
+        return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+    def asset_bytes(self, kind, asset):
+        if kind == 'surface':
+            return self.surface_bytes(asset)
+        if kind == 'frames':
+            # Atlas views share the atlas pages, which are counted once on their own
+            return sum(self.surface_bytes(surf) for surf in asset if surf.get_parent() is None)
+        if kind == 'sound':
+            return self.sound_bytes(asset)
+        return 0
+
+    def add(self, kind, path, asset):
+        """Store an asset that was loaded elsewhere (e.g. by the startup loader)."""
+        if kind == 'frames':
+            asset = tuple(asset)
+        self.assets[(kind, path)] = asset
+        self.sizes[(kind, path)] = self.asset_bytes(kind, asset)
+        return asset
+
+    def load(self, kind, path):
+        if kind == 'surface':
+            asset = load_image(path).convert_alpha()
+        elif kind == 'frames':
+            atlas = self.get_atlas()
+            if atlas is not None and path in atlas:
+                asset = atlas.frames(path)
+            elif folder_images(path):
+                asset = [load_image(file).convert_alpha() for file in folder_images(path)]
+            else:
+                asset = import_folder(path)  # Prints the error and gives a placeholder
+        elif kind == 'sound':
+            asset = load_sound(path)
+        else:
+            raise ValueError(f"Unknown asset kind: {kind}")
+        return self.add(kind, path, asset)
+
+    def get_atlas(self):
+        if not self.atlas_checked:
+            self.atlas_checked = True
+            self.atlas = load_atlas()
+            if self.atlas is not None:
+                self.assets[('atlas', ATLAS_INDEX)] = self.atlas
+                self.sizes[('atlas', ATLAS_INDEX)] = self.atlas.page_bytes()
+        return self.atlas
+
+    def is_loaded(self, kind, path):
+        return (kind, path) in self.assets
+
+    def get(self, kind, path):
+        asset = self.assets.get((kind, path))
+        if asset is None:
+            asset = self.load(kind, path)
+        return asset
+
+    def surface(self, path):
+        """Image loaded with convert_alpha."""
+        return self.get('surface', path)
+
+    def frames(self, path):
+        """Tuple of every image in a folder, in file name order."""
+        return self.get('frames', path)
+
+    def sound(self, path):
+        return self.get('sound', path)
+
+    def preload(self, surfaces=(), frames=(), sounds=()):
+        """Load assets ahead of time so later lookups do no disk I/O."""
+        for path in surfaces:
+            self.surface(path)
+        for path in frames:
+            self.frames(path)
+        for path in sounds:
+            self.sound(path)
+
+    def evict(self, kind=None, path=None):
+        """Forget matching assets (all of them by default). Holders keep their references."""
+        for key in list(self.assets):
+            if (kind is None or key[0] == kind) and (path is None or key[1] == path):
+                del self.assets[key]
+                del self.sizes[key]
+
+    def bytes_held(self):
+        return sum(self.sizes.values())
+
+    def report(self):
+        lines = [f"assets: {len(self.assets)} loaded, {self.bytes_held() / 1024:.0f} KiB"]
+        for (kind, path), size in sorted(self.sizes.items(), key=lambda item: -item[1]):
+            lines.append(f"  {kind:<7} {size / 1024:>8.0f} KiB  {path}")
+        return '\n'.join(lines)
+
+# Shared by everything that loads files at runtime
+assets = AssetRegistry()
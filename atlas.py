@@ -0,0 +1,145 @@
+"""Texture atlas packing (offline) and loading (runtime).
+
+Pack the default animation folders with:
+
+    python atlas.py
+
+which writes graphics/atlas/atlas.json plus one or more atlas_N.png pages.
+At runtime frames are handed out as subsurface views of the pages. The
+index records the mtime and size of every source image, and an atlas
+whose images changed is repacked when it is loaded.
+"""
+import json
+import os
+import sys
+import pygame
+
+ATLAS_DIR = 'graphics/atlas'
+ATLAS_INDEX = os.path.join(ATLAS_DIR, 'atlas.json')
+PAGE_SIZE = 2048
+
+CHARACTER_ANIMATIONS = [
+    f'{direction}{action}'
+    for direction in ('up', 'down', 'left', 'right')
+    for action in ('', '_idle', '_hoe', '_axe', '_water')
+]
+
+# Folders packed by default
+ATLAS_FOLDERS = (
+    [f'graphics/character/{animation}' for animation in CHARACTER_ANIMATIONS] +
+    ['graphics/soil', 'graphics/soil_water', 'graphics/water', 'graphics/fruit/corn', 'graphics/fruit/tomato']
+)
+
+def folder_images(path):
+    """Image files in a folder, in the same order import_folder loads them."""
+    if not os.path.isdir(path):
+        return []
+    return [os.path.join(path, name) for name in sorted(os.listdir(path))
+            if name.endswith(('.png', '.jpg', '.jpeg'))]
+
+def source_stamps(folders):
+    """path -> [mtime (ns), size] for every image in folders."""
+    stamps = {}
+    for folder in folders:
+        for path in folder_images(folder):
+            stat = os.stat(path)
+            stamps[path] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+def pack(folders=ATLAS_FOLDERS, output_dir=ATLAS_DIR, page_size=PAGE_SIZE):
+    """Shelf-pack every image in folders into atlas pages and write the index."""
+    images = []  # (folder, position in folder, surface)
+    for folder in folders:
+        for index, path in enumerate(folder_images(folder)):
+            images.append((folder, index, pygame.image.load(path)))
+
+    # Tallest first keeps shelves tight
+    images.sort(key=lambda item: (-item[2].get_height(), -item[2].get_width()))
+
+    pages = []  # list of placements: (folder, index, surface, x, y)
+    x = y = shelf_height = 0
+    for folder, index, surf in images:
+        width, height = surf.get_size()
+        if width > page_size or height > page_size:
+            raise ValueError(f"{folder}[{index}] is larger than an atlas page")
+        if not pages or x + width > page_size:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if not pages or y + height > page_size:
+            pages.append([])
+            x = y = shelf_height = 0
+        pages[-1].append((folder, index, surf, x, y))
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    os.makedirs(output_dir, exist_ok=True)
+    index_data = {'pages': [], 'folders': {}, 'packed': list(folders), 'sources': source_stamps(folders)}
+    for page_number, placements in enumerate(pages):
+        page_width = max(px + surf.get_width() for _, _, surf, px, _ in placements)
+        page_height = max(py + surf.get_height() for _, _, surf, _, py in placements)
+        page = pygame.Surface((page_width, page_height), pygame.SRCALPHA)
+        for folder, index, surf, px, py in placements:
+            page.blit(surf, (px, py))
+            frames = index_data['folders'].setdefault(folder, {})
+            frames[index] = [page_number, px, py, surf.get_width(), surf.get_height()]
+
+        name = f'atlas_{page_number}.png'
+        pygame.image.save(page, os.path.join(output_dir, name))
+        index_data['pages'].append(name)
+
+    # Frame lists in folder order
+    index_data['folders'] = {
+        folder: [frames[index] for index in sorted(frames)]
+        for folder, frames in index_data['folders'].items()
+    }
+    with open(os.path.join(output_dir, 'atlas.json'), 'w') as file:
+        json.dump(index_data, file, indent=1)
+    return index_data
+
+class Atlas:
+    """Loaded atlas pages plus the frame index written by pack()."""
+
+    def __init__(self, index_path=ATLAS_INDEX):
+        with open(index_path) as file:
+            index_data = json.load(file)
+        base = os.path.dirname(index_path)
+        self.pages = [pygame.image.load(os.path.join(base, name)).convert_alpha()
+                      for name in index_data['pages']]
+        self.folders = index_data['folders']
+        self.packed = index_data.get('packed', ATLAS_FOLDERS)
+        self.sources = index_data.get('sources')  # Missing in atlases packed before stamps
+
+    def is_stale(self):
+        """True if an image was added, removed or changed since the atlas was packed."""
+        return self.sources != source_stamps(self.packed)
+
+    def __contains__(self, folder):
+        return folder in self.folders
+
+    def frames(self, folder):
+        """Frames for a packed folder, as views into the atlas pages (no copies)."""
+        return [self.pages[page].subsurface((x, y, width, height))
+                for page, x, y, width, height in self.folders[folder]]
+
+    def page_bytes(self):
+        return sum(page.get_pitch() * page.get_height() for page in self.pages)
+
+def load_atlas(index_path=ATLAS_INDEX):
+    """Return the atlas if it has been packed, else None."""
+    if not os.path.exists(index_path):
+        return None
+    try:
+        atlas = Atlas(index_path)
+        if atlas.is_stale():
+            print(f"Atlas {index_path} is out of date, repacking")
+            pack(atlas.packed, os.path.dirname(index_path))
+            atlas = Atlas(index_path)
+        return atlas
+    except (OSError, ValueError, KeyError, pygame.error) as e:
+        print(f"Failed to load atlas {index_path}: {e}")
+        return None
+
+if __name__ == '__main__':
+    folders = sys.argv[1:] or ATLAS_FOLDERS
+    result = pack(folders)
+    print(f"Packed {sum(len(frames) for frames in result['folders'].values())} frames "
+          f"from {len(result['folders'])} folders into {len(result['pages'])} page(s) in {ATLAS_DIR}")
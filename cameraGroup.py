@@ -1,28 +1,163 @@
-
+from bisect import bisect_left, insort
 import pygame
 from pygame import Vector2
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, LAYERS
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from spatial_hash import SpatialHash
+
+# Extra space around the viewport that still counts as visible
+CULL_MARGIN = TILE_SIZE
 
 class CameraGroup(pygame.sprite.Group):
+    """Draws members by z layer and y order, culled to the viewport.
+
+    Only interpolated sprites are checked for movement every frame. Any other
+    member whose rect changes must report it through move().
+    """
+
     def __init__(self, target_surface):
         super().__init__()
         self.display_surface = target_surface
         self.offset = Vector2()
 
-    def custom_draw(self, player):
-        """Draw sprites with camera offset, ordered by layer."""
-        
+        # Spatial index used to cull sprites outside the viewport
+        self.spatial_index = SpatialHash(cell_size=4 * TILE_SIZE)
+        self.pending = set()  # Added sprites not indexed yet (rect is set after add)
+        self.stats = {'considered': 0, 'drawn': 0, 'reindexed': 0}
+
+        # One bucket per z layer, kept in draw (y) order
+        self.buckets = {}
+        self.sprite_layer = {}  # sprite -> z of the bucket it lives in
+        self.sequence = {}  # sprite -> insertion number, breaks y ties like a stable sort
+        self.next_sequence = 0
+        self.rank = {}  # sprite -> sort key it was last placed in its bucket by
+        self.moved = set()  # Members that reported a rect change since the last frame
+
+        # Moving sprites drawn between their last two simulation steps
+        self.interpolated = set()
+        self.previous = {}  # sprite -> rect.center before the current step
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.sequence[sprite] = self.next_sequence
+        self.next_sequence += 1
+        self.pending.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.pending.discard(sprite)
+        self.spatial_index.remove(sprite)
+        self.sequence.pop(sprite, None)
+        self.interpolated.discard(sprite)
+        self.previous.pop(sprite, None)
+        self.moved.discard(sprite)
+
+        z = self.sprite_layer.pop(sprite, None)
+        if z is not None:
+            self.unplace(sprite, self.buckets[z])
+            del self.rank[sprite]
+
+    def move(self, sprite):
+        """Re-index and re-order a member whose rect changed, before the next draw."""
+        self.moved.add(sprite)
+
+    def interpolate(self, sprite):
+        """Draw a moving sprite between simulation steps instead of snapping to the latest."""
+        self.interpolated.add(sprite)
+
+    def snapshot(self):
+        """Remember where interpolated sprites are before a simulation step."""
+        for sprite in self.interpolated:
+            self.previous[sprite] = sprite.rect.center
+
+    def draw_center(self, sprite, alpha):
+        """World-space center to draw a sprite at, alpha of the way into its last step."""
+        current = sprite.rect.center
+        previous = self.previous.get(sprite)
+        if previous is None or alpha >= 1:
+            return current
+        dx = current[0] - previous[0]
+        dy = current[1] - previous[1]
+        if abs(dx) > TILE_SIZE or abs(dy) > TILE_SIZE:
+            # Teleported (e.g. position reset), don't slide across the map
+            return current
+        return previous[0] + dx * alpha, previous[1] + dy * alpha
+
+    def sort_key(self, sprite):
+        return sprite.rect.centery, self.sequence[sprite]
+
+    def unplace(self, sprite, bucket):
+        del bucket[bisect_left(bucket, self.rank[sprite], key=self.rank.__getitem__)]
+
+    def place(self, sprite):
+        """Put a sprite at its y position in its bucket, if it is not there already."""
+        key = self.sort_key(sprite)
+        if self.rank.get(sprite) == key:
+            return
+        bucket = self.buckets[self.sprite_layer[sprite]]
+        if sprite in self.rank:
+            self.unplace(sprite, bucket)
+        self.rank[sprite] = key
+        insort(bucket, sprite, key=self.rank.__getitem__)
+
+    def refresh_index(self):
+        """Index newly added sprites and re-index the ones that moved."""
+        for sprite in self.pending:
+            self.spatial_index.insert(sprite)
+            if hasattr(sprite, 'z'):
+                self.buckets.setdefault(sprite.z, [])
+                self.sprite_layer[sprite] = sprite.z
+        reindexed = len(self.pending)
+
+        for sprite in self.interpolated | self.moved:
+            if self.spatial_index.move(sprite):
+                reindexed += 1
+        return reindexed
+
+    def refresh_order(self):
+        """Place new and moved sprites in their buckets; everything else stays where it is."""
+        for sprite in self.pending | self.interpolated | self.moved:
+            if sprite in self.sprite_layer:
+                self.place(sprite)
+        self.pending.clear()
+        self.moved.clear()
+
+    def get_viewport(self):
+        """World-space rect currently covered by the camera, plus the cull margin."""
+        viewport = pygame.Rect(int(self.offset.x), int(self.offset.y), SCREEN_WIDTH, SCREEN_HEIGHT)
+        return viewport.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+
+    def custom_draw(self, player, alpha=1):
+        """Draw visible sprites with camera offset, ordered by layer."""
+
         # Get the center offset
-        self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2
-        self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2
-
-        # Draw all sprites by layer
-        for layer in LAYERS.values():
-            for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-                if hasattr(sprite, 'z') and sprite.z == layer:
-                    # Get the offset rectangle for positioning
-                    offset_rect = sprite.rect.copy()
+        center = self.draw_center(player, alpha)
+        self.offset.x = center[0] - SCREEN_WIDTH / 2
+        self.offset.y = center[1] - SCREEN_HEIGHT / 2
+
+        # Only sprites overlapping the viewport are drawn
+        self.stats['reindexed'] = self.refresh_index()
+        self.refresh_order()
+        visible = self.spatial_index.query(self.get_viewport())
+        self.stats['considered'] = len(self)
+        self.stats['drawn'] = 0
+
+        # Group visible sprites by layer
+        visible_layers = {}
+        for sprite in visible:
+            z = self.sprite_layer.get(sprite)
+            if z is not None:
+                visible_layers.setdefault(z, []).append(sprite)
+
+        # Draw visible sprites by layer
+        for z in sorted(visible_layers):
+            for sprite in sorted(visible_layers[z], key=self.rank.__getitem__):
+                # Get the offset rectangle for positioning
+                offset_rect = sprite.rect.copy()
+                if sprite in self.interpolated:
+                    offset_rect.center = self.draw_center(sprite, alpha) - self.offset
+                else:
                     offset_rect.center -= self.offset
-                    
-                    # Draw the sprite
-                    self.display_surface.blit(sprite.image, offset_rect)
\ No newline at end of file
+
+                # Draw the sprite
+                self.display_surface.blit(sprite.image, offset_rect)
+                self.stats['drawn'] += 1
\ No newline at end of file
@@ -0,0 +1,182 @@
+import pygame
+from constants import LAYERS, TILE_SIZE
+from spatial_hash import moved
+
+# Size of a baked chunk in pixels
+CHUNK_SIZE = 512
+
+class PlacedTile:
+    """A surface placed at runtime at any pixel position, off the tile grid."""
+
+    __slots__ = ('x', 'y', 'surf')
+
+    def __init__(self, pos, surf):
+        self.x, self.y = pos
+        self.surf = surf
+
+class StaticChunk(pygame.sprite.Sprite):
+    """Pre-composited block of static tiles that draws as a single sprite."""
+
+    def __init__(self, area, z, groups):
+        super().__init__(groups)
+        self.area = area  # World-space region this chunk owns
+        self.z = z
+        self.layers = {}  # draw order -> TileLayer with tiles in this chunk
+        self.placed = []  # (draw order, PlacedTile)
+        self.dirty = True
+        self.baked = False
+        self.image = pygame.Surface((0, 0), pygame.SRCALPHA)
+        self.rect = pygame.Rect(self.area.topleft, (0, 0))
+
+    def add_layer(self, layer, order):
+        self.layers[order] = layer
+        self.dirty = True
+
+    def add_placed(self, tile, order):
+        self.placed.append((order, tile))
+        self.dirty = True
+
+    def remove_tile(self, pos):
+        """Remove every tile placed at pos. Returns True if something was removed."""
+        col, row = pos[0] // TILE_SIZE, pos[1] // TILE_SIZE
+        on_grid = (col * TILE_SIZE, row * TILE_SIZE) == tuple(pos)  # Grid tiles sit at their cell's corner
+        removed = False
+        for layer in self.layers.values():
+            if on_grid and layer[col, row]:
+                layer[col, row] = 0
+                removed = True
+        placed = [entry for entry in self.placed if (entry[1].x, entry[1].y) != tuple(pos)]
+        removed = removed or len(placed) != len(self.placed)
+        self.placed = placed
+        self.dirty = self.dirty or removed
+        return removed
+
+    def tiles(self, frame=0):
+        """(x, y, draw order, surf) for every tile in this chunk."""
+        tiles = []
+        for order, layer in self.layers.items():
+            for col, row, tile in layer.tiles_in(self.area):
+                tiles.append((col * TILE_SIZE, row * TILE_SIZE, (order, row, col), layer.surface(tile, frame)))
+        for order, tile in self.placed:
+            tiles.append((tile.x, tile.y, (order, tile.y, tile.x), tile.surf))
+        return tiles
+
+    def update_bounds(self, tiles):
+        tile_rects = [surf.get_rect(topleft=(x, y)) for x, y, _, surf in tiles]
+
+        # Bounds only ever grow, so a chunk never shrinks out of the cells it is indexed in
+        if self.baked:
+            tile_rects.append(self.rect)
+        if tile_rects:
+            rect = tile_rects[0].unionall(tile_rects[1:])
+            grew = self.baked and rect != self.rect
+            self.rect = rect
+            if grew:
+                moved(self)
+        self.baked = True
+
+    def composite(self, tiles):
+        """Blit tiles onto one surface, in the order the camera would draw them."""
+        image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for x, y, _, surf in sorted(tiles, key=lambda tile: (tile[1] + tile[3].get_height() // 2, tile[2])):
+            image.blit(surf, (x - self.rect.x, y - self.rect.y))
+        return image
+
+    def bake(self):
+        tiles = self.tiles()
+        self.update_bounds(tiles)
+        self.image = self.composite(tiles)
+        self.dirty = False
+
+    def update(self, dt):
+        if self.dirty:
+            self.bake()
+
+class AnimatedChunk(StaticChunk):
+    """Chunk of tiles that share one animation, with every frame pre-composited."""
+
+    def __init__(self, area, z, groups, animation):
+        self.animation = animation
+        self.frames = []
+        super().__init__(area, z, groups)
+
+    @property
+    def image(self):
+        return self.frames[self.animation.index]
+
+    @image.setter
+    def image(self, value):
+        self.frames = [value] * len(self.animation.frames)
+
+    def bake(self):
+        # Bake one chunk surface per animation frame
+        self.update_bounds(self.tiles())
+        self.frames = [self.composite(self.tiles(index)) for index in range(len(self.animation.frames))]
+        self.dirty = False
+
+class ChunkBaker:
+    """Collects static tiles per z layer and bakes them into chunk sprites.
+
+    Tiles on the y-sorted 'main' layer are baked into one-tile-high strips so
+    the player and other sprites still sort in front of or behind them.
+    """
+
+    def __init__(self, groups, chunk_size=CHUNK_SIZE):
+        self.groups = groups
+        self.chunk_size = chunk_size
+        self.chunks = {}  # (col, row, z) -> StaticChunk or AnimatedChunk
+        self.order = 0
+
+    def chunk_area(self, pos, z):
+        if z == LAYERS['main']:
+            col = pos[0] // self.chunk_size
+            row = pos[1] // TILE_SIZE
+            area = pygame.Rect(col * self.chunk_size, row * TILE_SIZE, self.chunk_size, TILE_SIZE)
+        else:
+            col = pos[0] // self.chunk_size
+            row = pos[1] // self.chunk_size
+            area = pygame.Rect(col * self.chunk_size, row * self.chunk_size, self.chunk_size, self.chunk_size)
+        return (col, row, z), area
+
+    def chunk_at(self, pos, z, animation=None):
+        """The chunk that owns pos on layer z, created on first use.
+
+        A chunk has at most one animation, so a z layer can hold static or
+        animated tiles of a single animation, not a mix.
+        """
+        key, area = self.chunk_area(pos, z)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if animation:
+                chunk = AnimatedChunk(area, z, self.groups, animation)
+            else:
+                chunk = StaticChunk(area, z, self.groups)
+            self.chunks[key] = chunk
+        elif getattr(chunk, 'animation', None) is not animation:
+            raise ValueError(f"Layer {z} mixes tiles with different animations")
+        return chunk
+
+    def add_layer(self, layer):
+        """Add a TileLayer to the chunks its tiles fall in."""
+        order = self.order
+        self.order += 1
+        for col, row, _ in layer.tiles():
+            self.chunk_at((col * TILE_SIZE, row * TILE_SIZE), layer.z, layer.animation).add_layer(layer, order)
+
+    def add_surface(self, pos, surf, z=LAYERS['main']):
+        """Place a surface with its top-left at pos; its chunk is re-baked on the next update."""
+        tile = PlacedTile(pos, surf)
+        self.chunk_at(pos, z).add_placed(tile, self.order)
+        self.order += 1
+        return tile
+
+    def remove_tile(self, pos, z=LAYERS['main']):
+        """Remove a baked tile; its chunk is re-baked on the next update."""
+        chunk = self.chunks.get(self.chunk_area(pos, z)[0])
+        return chunk is not None and chunk.remove_tile(pos)
+
+    def bake(self):
+        """Bake every chunk that changed since it was last baked."""
+        for chunk in self.chunks.values():
+            if chunk.dirty:
+                chunk.bake()
@@ -0,0 +1,262 @@
+"""Compiled binary form of the Tiled map.
+
+Tiled (.tmx/.tsx) stays the authoring format. On first use, or whenever the
+TMX, one of its tilesets or a tileset image changes, the map is compiled
+with pytmx into a single binary file holding:
+
+- the pixels of every tile/object image the map uses (deduplicated),
+- one uint16 array of image indices per tile layer (0 = empty); the hidden
+  Collision and Farmable layers are stored the same way, not as packed
+  bitmaps, and are turned into TileBitmaps when the level loads,
+- an object table per object group (Trees, Decoration, Player, ...).
+
+Later starts load that file with a single read and no XML parsing.
+CompiledMap mirrors the parts of the pytmx API the level uses.
+
+Compile by hand with: python compiled_map.py [data/map.tmx]
+"""
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ElementTree
+from array import array
+import pygame
+
+COMPILED_DIR = os.path.join('.cache', 'maps')
+
+MAGIC = b'BHMP'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHHHH')  # magic, version, width, height, tilewidth, tileheight
+COUNT = struct.Struct('<H')
+SOURCE = struct.Struct('<qq')  # mtime (ns), size
+IMAGE = struct.Struct('<HHBBBBB')  # width, height, per-pixel alpha, has colorkey, colorkey r, g, b
+OBJECT = struct.Struct('<ddddH')  # x, y, width, height, image index + 1 (0 = none)
+
+TILE_LAYER, OBJECT_GROUP = 0, 1
+NO_STRING = 0xFFFF
+
+def compiled_path(tmx_path):
+    name = os.path.splitext(os.path.basename(tmx_path))[0]
+    return os.path.join(COMPILED_DIR, f'{name}.bhm')
+
+def map_sources(tmx_path):
+    """The TMX plus every tileset and image it pulls in."""
+    sources = [tmx_path]
+    map_dir = os.path.dirname(tmx_path)
+    root = ElementTree.parse(tmx_path).getroot()
+    for tileset in root.iter('tileset'):
+        tileset_root, tileset_dir = tileset, map_dir
+        if tileset.get('source'):
+            tsx_path = os.path.normpath(os.path.join(map_dir, tileset.get('source')))
+            sources.append(tsx_path)
+            tileset_root = ElementTree.parse(tsx_path).getroot()
+            tileset_dir = os.path.dirname(tsx_path)
+        for image in tileset_root.iter('image'):
+            sources.append(os.path.normpath(os.path.join(tileset_dir, image.get('source'))))
+    return sources
+
+def source_stamp(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return 0, 0
+
+# Writing
+
+def pack_string(value):
+    if value is None:
+        return COUNT.pack(NO_STRING)
+    data = str(value).encode('utf-8')
+    return COUNT.pack(len(data)) + data
+
+def compile_map(tmx_path, output_path=None):
+    """Parse the TMX with pytmx and write the compiled map. Returns its path."""
+    from pytmx import TiledTileLayer, TiledObjectGroup
+    from pytmx.util_pygame import load_pygame
+
+    output_path = output_path or compiled_path(tmx_path)
+    tmx_data = load_pygame(tmx_path)
+
+    images = []  # Unique surfaces in the order they are written
+    image_index = {}  # id(surface) -> position in images
+
+    def index_of(surf):
+        if surf is None:
+            return 0
+        if id(surf) not in image_index:
+            image_index[id(surf)] = len(images)
+            images.append(surf)
+        return image_index[id(surf)] + 1
+
+    layers = []
+    for layer in tmx_data.layers:
+        if isinstance(layer, TiledTileLayer):
+            data = array('H', [0]) * (tmx_data.width * tmx_data.height)
+            for x, y, surf in layer.tiles():
+                data[y * tmx_data.width + x] = index_of(surf)
+            layers.append(bytes([TILE_LAYER]) + pack_string(layer.name) + data.tobytes())
+        elif isinstance(layer, TiledObjectGroup):
+            chunk = [bytes([OBJECT_GROUP]), pack_string(layer.name), COUNT.pack(len(layer))]
+            for obj in layer:
+                chunk.append(pack_string(obj.name))
+                chunk.append(pack_string(getattr(obj, 'type', None)))
+                chunk.append(OBJECT.pack(obj.x, obj.y, obj.width, obj.height, index_of(obj.image)))
+            layers.append(b''.join(chunk))
+
+    sources = map_sources(tmx_path)
+    parts = [
+        HEADER.pack(MAGIC, VERSION, tmx_data.width, tmx_data.height, tmx_data.tilewidth, tmx_data.tileheight),
+        COUNT.pack(len(sources))
+    ]
+    for path in sources:
+        parts.append(pack_string(path) + SOURCE.pack(*source_stamp(path)))
+    parts.append(COUNT.pack(len(images)))
+    for surf in images:
+        # Opaque tiles must stay opaque: their alpha bytes are not meaningful
+        alpha = bool(surf.get_flags() & pygame.SRCALPHA)
+        colorkey = surf.get_colorkey()
+        parts.append(IMAGE.pack(*surf.get_size(), alpha, colorkey is not None, *(colorkey or (0, 0, 0))[:3]))
+        parts.append(pygame.image.tobytes(surf, 'RGBA'))
+    parts.append(COUNT.pack(len(layers)))
+    parts.extend(layers)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp = f'{output_path}.tmp'
+    with open(temp, 'wb') as file:
+        file.write(b''.join(parts))
+    os.replace(temp, output_path)
+    return output_path
+
+# Reading
+
+class Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt):
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def count(self):
+        return self.unpack(COUNT)[0]
+
+    def string(self):
+        length = self.count()
+        if length == NO_STRING:
+            return None
+        value = bytes(self.data[self.offset:self.offset + length]).decode('utf-8')
+        self.offset += length
+        return value
+
+    def take(self, size):
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+class CompiledTileLayer:
+    def __init__(self, name, width, height, data, images):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.data = data  # array('H') of image index + 1, row-major
+        self.images = images
+
+    def tiles(self):
+        """(x, y, surface) for every non-empty tile, like pytmx."""
+        width = self.width
+        for index, value in enumerate(self.data):
+            if value:
+                yield index % width, index // width, self.images[value - 1]
+
+class CompiledObject:
+    def __init__(self, name, type, x, y, width, height, image):
+        self.name = name
+        self.type = type
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.image = image
+
+class CompiledObjectGroup(list):
+    def __init__(self, name, objects):
+        super().__init__(objects)
+        self.name = name
+
+class CompiledMap:
+    def __init__(self, data):
+        reader = Reader(data)
+        magic, version, self.width, self.height, self.tilewidth, self.tileheight = reader.unpack(HEADER)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a compiled map (or an older version)")
+
+        self.sources = []
+        for _ in range(reader.count()):
+            self.sources.append((reader.string(), reader.unpack(SOURCE)))
+
+        self.images = []
+        for _ in range(reader.count()):
+            width, height, alpha, has_colorkey, *colorkey = reader.unpack(IMAGE)
+            pixels = reader.take(width * height * 4)
+            view = pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+            image = view.convert_alpha() if alpha else view.convert()
+            if has_colorkey:
+                image.set_colorkey(colorkey)
+            self.images.append(image)
+            del view
+            pixels.release()
+
+        self.layers = []
+        for _ in range(reader.count()):
+            kind = reader.take(1)[0]
+            name = reader.string()
+            if kind == TILE_LAYER:
+                data = array('H')
+                data.frombytes(reader.take(self.width * self.height * 2))
+                self.layers.append(CompiledTileLayer(name, self.width, self.height, data, self.images))
+            else:
+                objects = []
+                for _ in range(reader.count()):
+                    obj_name, obj_type = reader.string(), reader.string()
+                    x, y, width, height, image = reader.unpack(OBJECT)
+                    objects.append(CompiledObject(obj_name, obj_type, x, y, width, height,
+                                                  self.images[image - 1] if image else None))
+                self.layers.append(CompiledObjectGroup(name, objects))
+        self.layer_names = {layer.name: layer for layer in self.layers}
+
+    def is_stale(self):
+        return any(source_stamp(path) != tuple(stamp) for path, stamp in self.sources)
+
+    def get_layer_by_name(self, name):
+        try:
+            return self.layer_names[name]
+        except KeyError:
+            raise ValueError(f"Layer '{name}' not found")
+
+def read_map(path):
+    with open(path, 'rb') as file:
+        return CompiledMap(file.read())
+
+def load_map(tmx_path):
+    """Load the compiled map, (re)compiling it first if it is missing or out of date."""
+    path = compiled_path(tmx_path)
+    if os.path.exists(path):
+        try:
+            compiled = read_map(path)
+            if not compiled.is_stale():
+                return compiled
+        except (OSError, ValueError, struct.error, IndexError, pygame.error) as e:
+            # UnicodeDecodeError is a ValueError; any unreadable cache falls back to the TMX
+            print(f"Recompiling {tmx_path}: cached map unreadable ({e})")
+    return read_map(compile_map(tmx_path, path))
+
+if __name__ == '__main__':
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    tmx = sys.argv[1] if len(sys.argv) > 1 else 'data/map.tmx'
+    print(f"Compiled {tmx} -> {compile_map(tmx)}")
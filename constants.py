@@ -20,6 +20,10 @@ MAX_CHARACTERS = 64
 # Movement speed
 SPEED = 200
 
+# Fixed simulation step
+SIMULATION_RATE = 60  # Updates per simulated second, whatever the display rate
+MAX_SIMULATION_STEPS = 5  # Per frame at normal speed; time beyond this is dropped
+
 # UI Positions
 OVERLAY_POSITIONS = {
     'tool': (40, SCREEN_HEIGHT - 15),
@@ -55,6 +59,19 @@ LAYERS = {
     'snow falling': 14,  # Added 'snow falling' layer
     'overlay': 15
 }
+
+# Day/night cycle
+DAY_LENGTH = 20 * 60  # Seconds of play per in-game day
+OFFLINE_DAY_LENGTH = 24 * 60 * 60  # Real seconds per game day while the game is closed
+DAY_COLOR = (255, 255, 255)
+NIGHT_COLOR = (38, 101, 189)
+LIGHT_STEPS = 240  # Tint changes at most this many times per day
+
+# Weather
+WEATHER_CHANCES = {'clear': 0.6, 'rain': 0.3, 'snow': 0.1}  # Odds for each day
+OVERCAST = {'clear': 0, 'rain': 0.3, 'snow': 0.15}  # How much each darkens the sky at full intensity
+FORECAST_DAYS = 14  # Days of weather computed in one batch
+
 # Apple positions for trees
 APPLE_POS = {
     'Small': [(18,17), (30,37), (30,45), (20,30), (30,10)],
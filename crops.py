@@ -0,0 +1,105 @@
+import numpy as np
+from constants import GROW_SPEED
+
+# Crop kinds, stored as an index into this tuple
+CROP_TYPES = tuple(GROW_SPEED)
+
+class CropField:
+    """State of every crop on the farm, one array per attribute.
+
+    A crop's slot is its index into the arrays. Removing a crop moves the
+    last crop into its slot, so slots stay packed and Plant.slot is updated.
+    """
+
+    COLUMNS = ('kind', 'age', 'max_age', 'grow_speed', 'col', 'row', 'harvestable')
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.age = np.zeros(capacity, dtype=np.float64)
+        self.max_age = np.zeros(capacity, dtype=np.float64)
+        self.grow_speed = np.zeros(capacity, dtype=np.float64)
+        self.col = np.zeros(capacity, dtype=np.int32)
+        self.row = np.zeros(capacity, dtype=np.int32)
+        self.harvestable = np.zeros(capacity, dtype=bool)
+        self.plants = [None] * capacity  # slot -> Plant sprite
+
+    def __len__(self):
+        return self.size
+
+    def reserve(self, capacity):
+        """Make room for at least capacity crops."""
+        if capacity <= len(self.plants):
+            return
+        capacity = max(capacity, len(self.plants) * 2)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+        self.plants.extend([None] * (capacity - len(self.plants)))
+
+    def add(self, plant, plant_type, tile, grow_speed, max_age):
+        """Store a new crop and return its slot."""
+        self.reserve(self.size + 1)
+        slot = self.size
+        self.kind[slot] = CROP_TYPES.index(plant_type)
+        self.age[slot] = 0
+        self.max_age[slot] = max_age
+        self.grow_speed[slot] = grow_speed
+        self.col[slot], self.row[slot] = tile
+        self.harvestable[slot] = False
+        self.plants[slot] = plant
+        self.size += 1
+        return slot
+
+    def remove(self, slot):
+        """Drop the crop in slot, filling the gap with the last crop."""
+        last = self.size - 1
+        if slot != last:
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            self.plants[slot] = self.plants[last]
+            self.plants[slot].slot = slot
+        self.plants[last] = None
+        self.size = last
+
+    def stage(self, slot):
+        """Index of the growth frame a crop shows."""
+        return int(self.age[slot])
+
+    def watered(self, water_mask):
+        """Which crops stand on watered tiles, from a [row, col] boolean mask."""
+        n = self.size
+        return water_mask[self.row[:n], self.col[:n]]
+
+    def step(self, watered, new_age):
+        """Apply new ages to watered crops; return the plants whose stage changed."""
+        n = self.size
+        age = self.age[:n]
+        old_stage = age.astype(np.int32)
+        np.copyto(age, np.minimum(new_age, self.max_age[:n]), where=watered)
+        self.harvestable[:n] |= watered & (age >= self.max_age[:n])
+        changed = np.nonzero(age.astype(np.int32) != old_stage)[0]
+        return [self.plants[slot] for slot in changed]
+
+    def grow(self, water_mask):
+        """Grow every watered crop by one day in one batch."""
+        n = self.size
+        return self.step(self.watered(water_mask), self.age[:n] + self.grow_speed[:n])
+
+    def advance(self, days_grown):
+        """Grow each crop by its own number of days in one step (closed form)."""
+        n = self.size
+        days_grown = np.asarray(days_grown)
+        return self.step(days_grown > 0, self.age[:n] + self.grow_speed[:n] * days_grown)
+
+    def ripen(self, water_mask):
+        """Bring every watered crop straight to full growth."""
+        return self.step(self.watered(water_mask), self.max_age[:self.size])
+
+    def harvestable_tiles(self):
+        """(col, row) arrays of every harvestable crop."""
+        ripe = self.harvestable[:self.size]
+        return self.col[:self.size][ripe], self.row[:self.size][ripe]
@@ -4,6 +4,7 @@ from constants import (
     PAGE_WIDTH, PAGE_HEIGHT, 
     MAX_CHARACTERS
 )
+from text_cache import text_cache
 
 class Editor:
     def __init__(self):
@@ -72,7 +73,7 @@ class Editor:
     
     def display(self):
         # Update text surface with current input
-        self.text = self.font.render(self.user_input, True, 'black', 'white')
+        self.text = text_cache.render(self.font, self.user_input, True, 'black', 'white')
         
         # Draw the text
         self.display_surface.blit(self.text, self.text_rect)
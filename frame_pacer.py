@@ -0,0 +1,92 @@
+import pygame
+
+class FramePacer:
+    """Paces the main loop: full rate normally, sleeping on screens that rarely change."""
+
+    def __init__(self, fps=60):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle = False
+        self.was_idle = False
+
+    def get_events(self, idle_timeout=None):
+        """Return this frame's events.
+
+        idle_timeout is the number of milliseconds until the screen next
+        changes, or None if it is animating. When set, block until then
+        or until an event arrives, whichever comes first.
+        """
+        self.was_idle = self.idle
+        self.idle = idle_timeout is not None
+        if not self.idle:
+            return pygame.event.get()
+
+        event = pygame.event.wait(max(1, int(idle_timeout)))
+        if event.type == pygame.NOEVENT:
+            return []
+
+        # Input goes back to full rate right away
+        self.idle = False
+        return [event] + pygame.event.get()
+
+    def tick(self):
+        """Advance the clock and return dt in seconds."""
+        if self.idle:
+            # Already waited for the next change, don't sleep again
+            return self.clock.tick() / 1000
+
+        dt = self.clock.tick(self.fps) / 1000
+        if self.was_idle:
+            # The first frame after sleeping would otherwise carry the whole wait
+            dt = min(dt, 1 / self.fps)
+        return dt
+
+    def get_fps(self):
+        return self.clock.get_fps()
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation steps.
+
+    Leftover time carries over to the next frame; alpha is how far the render
+    sits between the last two steps. At most max_steps run per frame, and time
+    beyond that is dropped rather than making the next frame slower still.
+    """
+
+    SPEEDS = (1, 2, 4)
+
+    def __init__(self, rate=60, max_steps=5):
+        self.step = 1 / rate
+        self.max_steps = max_steps
+        self.time_scale = 1  # Simulated seconds per real second
+        self.accumulator = 0
+        self.dropped = 0  # Total simulated seconds skipped by the cap
+
+    def advance(self, dt):
+        """Add a frame's dt and return how many steps to run for it."""
+        self.accumulator += dt * self.time_scale
+        steps = int(self.accumulator / self.step)
+        limit = self.max_steps * max(1, int(self.time_scale))
+        if steps > limit:
+            # Spiral of death guard: keep only the fraction of a step
+            self.dropped += (steps - limit) * self.step
+            self.accumulator %= self.step
+            return limit
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
+
+    def next_speed(self):
+        """Cycle how much faster than real time the simulation runs."""
+        index = (self.SPEEDS.index(self.time_scale) + 1) % len(self.SPEEDS)
+        self.time_scale = self.SPEEDS[index]
+        return self.time_scale
+
+    def report(self):
+        return f"simulation: {self.time_scale}x, {1 / self.step:.0f} steps/s, {self.dropped:.2f}s dropped"
+
+    def reset(self):
+        """Forget pending time, e.g. while the simulation is paused."""
+        self.accumulator = 0
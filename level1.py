@@ -2,16 +2,24 @@ import pygame
 from constants import *
 from player import Player
 from overlay import Overlay
-from sprites import Terrain, WaterTile, WildFlower, Tree, Interaction, Particle
-from pytmx.util_pygame import load_pygame
-from sprite_loader import import_folder
+from sprites import Terrain, WildFlower, Tree, Interaction, Particle
+from compiled_map import load_map
+from assets import assets
 from transition1 import Transition
 from SoilLayer import SoilLayer
 from menu1 import Menu
 from cameraGroup import CameraGroup
+from spatial_hash import SpatialGroup
+from tile_bitmap import TileBitmap, SOLID, WALL
+from tile_layer import TileLayer
+from chunks import ChunkBaker
+from animation import animation_clock
 from animal import Animal
 from random import randint
 from pomodoroTimer import Pomodoro
+from weather import Sky, Weather, WeatherSchedule
+from profiling import profiler
+from pool import SpritePool
 
 
 class Level:
@@ -21,37 +29,56 @@ class Level:
 
         # Sprite groups
         self.all_sprites = CameraGroup(self.farm_screen)
-        self.collision_sprites = pygame.sprite.Group()
-        self.tree_sprites = pygame.sprite.Group()
+        self.collision_sprites = SpatialGroup(cell_size=4 * TILE_SIZE)
+        self.tree_sprites = SpatialGroup(cell_size=4 * TILE_SIZE)
         self.interaction_sprites = pygame.sprite.Group()
         self.animal_sprites = pygame.sprite.Group()
+        self.particle_pool = SpritePool(Particle, [self.all_sprites])  # Harvest flashes
+
+        # Static tiles are baked into chunks instead of drawn one by one
+        self.static_chunks = ChunkBaker(self.all_sprites)
 
         # Soil setup
-        self.soil_layer = SoilLayer(self.all_sprites, self.collision_sprites)
+        with profiler.phase('SoilLayer'):
+            self.soil_layer = SoilLayer(self.all_sprites, self.collision_sprites)
 
         # Timer setup
         self.timer_active = False
-        self.pomodoro = Pomodoro(self.farm_screen, self.soil_layer)
+        with profiler.phase('Pomodoro'):
+            self.pomodoro = Pomodoro(self.farm_screen, self.soil_layer)
         self.last_working_state = True
 
+        # Day/night lighting (lights are added while the map is set up)
+        self.sky = Sky(self.farm_screen)
+        self.weather = Weather()
+
+        # Seeded weather for every day, forecast ahead of time
+        self.day = 0
+        self.schedule = WeatherSchedule()
+
         # Setup level components
         self.setup()
-        self.setup_animals()
+        self.apply_weather()
+        with profiler.phase('setup_animals'):
+            self.setup_animals()
 
         # Set a better starting position in an open area
         self.default_position = pygame.math.Vector2(1640, 1825)
         #self.default_position = pygame.math.Vector2(1640, 1640)
 
         # UI elements
-        self.overlay = Overlay(self.player)
+        with profiler.phase('Overlay'):
+            self.overlay = Overlay(self.player)
         self.transition = Transition(self.reset, self.player)
 
         # Menu
-        self.menu = Menu(self.player, self.toggle_shop, self.farm_screen)
+        with profiler.phase('Menu'):
+            self.menu = Menu(self.player, self.toggle_shop, self.farm_screen)
         self.menu_active = False
 
         # Setup audio
-        self.setup_audio()
+        with profiler.phase('setup_audio'):
+            self.setup_audio()
 
         # Ensure player starts locked
         self.player.set_movement_lock(True)
@@ -76,89 +103,87 @@ class Level:
         self.player.rect.center = self.player.hitbox.center
 
     def setup(self):
-        tmx_data = load_pygame('data/map.tmx')
+        # Compiled from the TMX on first run (and whenever it changes)
+        with profiler.phase('load_map'):
+            tmx_data = load_map('data/map.tmx')
+
+        # Hidden layers become tile bitmaps: static collision and where soil can be hoed
+        self.collision_tiles = TileBitmap.from_layer(tmx_data.get_layer_by_name('Collision'), SOLID)
+        self.soil_layer.farmable = TileBitmap.from_layer(tmx_data.get_layer_by_name('Farmable'))
 
         # Setup house layers
-        self.setup_house(tmx_data)
+        with profiler.phase('setup_house'):
+            self.setup_house(tmx_data)
 
         # Setup map layers and boundaries
-        self.setup_map_elements(tmx_data)
-        self.add_map_boundaries(tmx_data)
-        self.setup_player_and_interactions(tmx_data)
+        with profiler.phase('setup_map_elements'):
+            self.setup_map_elements(tmx_data)
+        with profiler.phase('add_map_boundaries'):
+            self.add_map_boundaries(tmx_data)
+        with profiler.phase('setup_player_and_interactions'):
+            self.setup_player_and_interactions(tmx_data)
   
     def setup_house(self, tmx_data):
-        # Define door area
-        """
+        # Define door area, in tile coordinates like the layer's tiles
         DOOR_POSITIONS = [
             (15, 10), (16, 10),  # Door entrance
             (15, 11), (16, 11)   # Inside house near door
-            41
-        ]
-        """
-        DOOR_POSITIONS = [
-            (15 * TILE_SIZE, 10* TILE_SIZE), (16* TILE_SIZE, 10* TILE_SIZE),  # Door entrance
-            (15* TILE_SIZE, 11* TILE_SIZE), (16* TILE_SIZE, 11* TILE_SIZE)   # Inside house near door
         ]
 
         # House floor and bottom furniture (no collision)
-        for layer in ['HouseFloor', 'HouseFurnitureBottom']:
-            for x, y, surf in tmx_data.get_layer_by_name(layer).tiles():
-                if surf:
-                    Terrain(
-                        pos=(x * TILE_SIZE, y * TILE_SIZE),
-                        surf=surf,
-                        groups=[self.all_sprites],
-                        z=LAYERS['house bottom']
-                    )
+        floor = TileLayer.from_layer(tmx_data.get_layer_by_name('HouseFloor'), LAYERS['house bottom'])
+        furniture = TileLayer.from_layer(tmx_data.get_layer_by_name('HouseFurnitureBottom'), LAYERS['house bottom'])
+        self.static_chunks.add_layer(floor)
+        self.static_chunks.add_layer(furniture)
+
+        # Glow from the house windows at night
+        floor_rects = [rect for rect in (floor.bounds(), furniture.bounds()) if rect]
+        if floor_rects:
+            house = floor_rects[0].unionall(floor_rects[1:])
+            self.sky.add_light(house.center, max(house.width, house.height) // 2 + TILE_SIZE * 2)
 
         # House walls with door handling
-        for x, y, surf in tmx_data.get_layer_by_name('HouseWalls').tiles():
-            if surf:
-                if (x, y) not in DOOR_POSITIONS:
-                    # Regular wall with collision
-                    Terrain(
-                        pos=(x * TILE_SIZE, y * TILE_SIZE),
-                        surf=surf,
-                        groups=[self.all_sprites, self.collision_sprites],
-                        #z=LAYERS['house bottom']
-                    )
-                else:
-                    # Door area without collision
-                    Terrain(
-                        pos=(x * TILE_SIZE, y * TILE_SIZE),
-                        surf=surf,
-                        groups=[self.all_sprites],
-                        z=LAYERS['house bottom']
-                    )
+        walls = TileLayer.from_layer(tmx_data.get_layer_by_name('HouseWalls'), LAYERS['main'])
+        doors = TileLayer(walls.width, walls.height, walls.surfaces, LAYERS['house bottom'])
+        for x, y, tile in list(walls.tiles()):
+            if (x, y) not in DOOR_POSITIONS:
+                # Regular wall with collision
+                self.add_wall_tile(x, y)
+            else:
+                # Door area without collision, drawn under the player
+                doors[x, y] = tile
+                walls[x, y] = 0
+        self.static_chunks.add_layer(walls)
+        self.static_chunks.add_layer(doors)
 
         # House top furniture (above player)
-        for x, y, surf in tmx_data.get_layer_by_name('HouseFurnitureTop').tiles():
-            if surf:
-                Terrain(
-                    pos=(x * TILE_SIZE, y * TILE_SIZE),
-                    surf=surf,
-                    groups=[self.all_sprites],
-                    z=LAYERS['house top']
-                )
+        self.static_chunks.add_layer(
+            TileLayer.from_layer(tmx_data.get_layer_by_name('HouseFurnitureTop'), LAYERS['house top'])
+        )
   
+    def add_wall_tile(self, x, y):
+        """Block the thin strip of a fence or wall tile.
+
+        The Collision layer also covers the house walls; those stay WALL so the
+        house interior is as roomy as with the old Terrain hitboxes.
+        """
+        self.collision_tiles[x, y] = WALL
+
     def setup_map_elements(self, tmx_data):
         # Fence
-        for x, y, surf in tmx_data.get_layer_by_name('Fence').tiles():
-            if surf:
-                Terrain(
-                    pos=(x * TILE_SIZE, y * TILE_SIZE),
-                    surf=surf,
-                    groups=[self.all_sprites, self.collision_sprites]
-                )
-
-        # Water
-        water_frames = import_folder('graphics/water')
-        for x, y, _ in tmx_data.get_layer_by_name('Water').tiles():
-            WaterTile(
-                pos=(x * TILE_SIZE, y * TILE_SIZE),
-                frames=water_frames,
-                groups=[self.all_sprites]
-            )
+        fence = TileLayer.from_layer(tmx_data.get_layer_by_name('Fence'), LAYERS['main'])
+        for x, y, _ in fence.tiles():
+            self.add_wall_tile(x, y)
+        self.static_chunks.add_layer(fence)
+
+        # Water (animated chunks, one pre-composited surface per frame)
+        water_frames = assets.frames('graphics/water')
+        self.static_chunks.add_layer(TileLayer.from_layer(
+            tmx_data.get_layer_by_name('Water'),
+            LAYERS['water'],
+            animation=animation_clock.get(water_frames)
+        ))
+        self.static_chunks.bake()
 
         # Trees
         for obj in tmx_data.get_layer_by_name('Trees'):
@@ -179,7 +204,7 @@ class Level:
             )
 
         # Ground
-        ground = pygame.image.load('graphics/world/ground.png').convert_alpha()
+        ground = assets.surface('graphics/world/ground.png')
         Terrain(
             pos=(0, 0),
             surf=ground,
@@ -189,12 +214,14 @@ class Level:
 
     def setup_animals(self):
         # Position the chicken in the open area near the player
-        Animal(
+        animal = Animal(
             animal_type='chicken',
             start_pos=(550, 500),
             groups=[self.all_sprites, self.animal_sprites],
-            collision_sprites=self.collision_sprites
+            collision_sprites=self.collision_sprites,
+            collision_tiles=self.collision_tiles
         )
+        self.all_sprites.interpolate(animal)
 
     def add_map_boundaries(self, tmx_data):
         map_width = tmx_data.width * TILE_SIZE
@@ -225,11 +252,13 @@ class Level:
                     pos=(obj.x, obj.y),
                     group=self.all_sprites,
                     collision_sprites=self.collision_sprites,
+                    collision_tiles=self.collision_tiles,
                     tree_sprites=self.tree_sprites,
                     interaction_sprites=self.interaction_sprites,
                     soil_layer=self.soil_layer,
                     toggle_shop=self.toggle_shop
                 )
+                self.all_sprites.interpolate(self.player)
             elif obj.name == 'Trader':
                 Interaction(
                     pos=(obj.x, obj.y),
@@ -244,6 +273,7 @@ class Level:
                     groups=[self.interaction_sprites],
                     name=obj.name
                 )
+                self.sky.add_light((obj.x + obj.width / 2, obj.y + obj.height / 2), TILE_SIZE * 2)
 
     def player_add(self, item):
         self.player.item_inventory[item] += 1
@@ -254,19 +284,40 @@ class Level:
     def reset(self):
         self.soil_layer.update_plants()
 
+        # Soil dries overnight, then the new day's weather (rain waters it again)
+        self.soil_layer.remove_water()
+        self.day += 1
+        self.apply_weather()
+        self.sky.start_day()
+
         for tree in self.tree_sprites.sprites():
             for apple in tree.apple_sprites.sprites():
                 apple.kill()
             tree.create_fruit()
 
+    def apply_weather(self):
+        """Set up today's scheduled weather: soil watering, particles and sky."""
+        kind, intensity = self.schedule.weather_on(self.day)
+        self.schedule.forget_before(self.day)
+
+        # Rain waters the whole field in one bulk update
+        self.soil_layer.raining = kind == 'rain'
+        if self.soil_layer.raining:
+            self.soil_layer.water_all()
+
+        self.weather.set_rain(intensity if kind == 'rain' else 0)
+        self.weather.set_snow(intensity if kind == 'snow' else 0)
+        self.sky.set_overcast(OVERCAST[kind] * intensity)
+
     def tree_collision(self):
         """Handle tree collision and damage"""
         keys = pygame.key.get_pressed()
-        for tree in self.tree_sprites.sprites():
-            if tree.rect.colliderect(self.player.hitbox) and self.player.selected_tool == 'axe' and keys[pygame.K_SPACE]:
+        if self.player.selected_tool == 'axe' and keys[pygame.K_SPACE]:
+            for tree in self.tree_sprites.query(self.player.hitbox):
                 tree.damage()
 
-    def run(self, dt, event_list):
+    def begin_frame(self, event_list):
+        """Handle this frame's input and timer state. Returns False while the farm is hidden."""
         self.handle_input(event_list)
 
         # If timer isn't active, player shouldn't be able to move or act
@@ -287,7 +338,7 @@ class Level:
                     self.farm_screen.fill('black')
                     self.pomodoro.draw()
                     self.last_working_state = True
-                    return
+                    return False
                 else:
                     # Only reset position when transitioning from work to break
                     if self.last_working_state:
@@ -295,17 +346,33 @@ class Level:
                         self.last_working_state = False
                     self.player.set_movement_lock(False)
                     self.player.set_action_lock(False)
+        return True
+
+    def update(self, dt):
+        """Advance the farm by one fixed simulation step."""
+        if not self.menu_active:
+            self.all_sprites.snapshot()
+            self.all_sprites.update(dt)
+            animation_clock.update(dt)
+            self.plant_collision()
+            if self.timer_active and not self.pomodoro.working:
+                self.tree_collision()
+            self.sky.update(dt)
+            self.weather.update(dt, self.all_sprites.offset)
+
+        if self.player.sleep or self.transition.active:
+            self.transition.update(dt)
 
+    def draw(self, alpha=1):
+        """Draw the farm, with moving sprites alpha of the way through the last step."""
         self.farm_screen.fill('black')
 
         if self.menu_active:
             self.menu.update()
         else:
-            self.all_sprites.custom_draw(self.player)
-            self.all_sprites.update(dt)
-            self.plant_collision()
-            if self.timer_active and not self.pomodoro.working:
-                self.tree_collision()
+            self.all_sprites.custom_draw(self.player, alpha)
+            self.weather.draw(self.farm_screen, self.all_sprites.offset)
+            self.sky.display(self.all_sprites.offset)
 
         self.overlay.display()
 
@@ -313,7 +380,13 @@ class Level:
             self.pomodoro.draw()
 
         if self.player.sleep or self.transition.active:
-            self.transition.play(dt)
+            self.transition.draw()
+
+    def idle_timeout(self):
+        """Milliseconds until the screen next changes, or None if it is animating."""
+        if not self.timer_active or self.menu_active or self.player.sleep or self.transition.active:
+            return None
+        return self.pomodoro.idle_timeout()
 
     def handle_input(self, event_list):
         for event in event_list:
@@ -336,18 +409,12 @@ class Level:
                     self.toggle_shop()
 
     def plant_collision(self):
-        if hasattr(self.soil_layer, 'plant_sprites'):
-            for plant in self.soil_layer.plant_sprites.sprites():
-                if plant.harvestable and plant.rect.colliderect(self.player.hitbox):
-                    self.player_add(plant.plant_type)
-                    plant.kill()
-                    Particle(
-                        pos=plant.rect.topleft,
-                        surf=plant.image,
-                        groups=[self.all_sprites],
-                        z=LAYERS['main']
-                    )
-                    grid_x = plant.rect.centerx // TILE_SIZE
-                    grid_y = plant.rect.centery // TILE_SIZE
-                    if 'P' in self.soil_layer.grid[grid_y][grid_x]:
-                        self.soil_layer.grid[grid_y][grid_x].remove('P')
+        for plant in self.soil_layer.plants_in(self.player.hitbox):
+            if plant.harvestable:
+                self.player_add(plant.plant_type)
+                self.soil_layer.remove_plant(plant)
+                self.particle_pool.acquire(
+                    pos=plant.rect.topleft,
+                    surf=plant.image,
+                    z=LAYERS['main']
+                )
@@ -0,0 +1,107 @@
+import math
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, DAY_COLOR, NIGHT_COLOR, LIGHT_STEPS
+
+def daylight(time_of_day):
+    """How bright the sky is (0 = night, 1 = full day) at a time of day in [0, 1)."""
+    # Day runs from morning (0.0) until dusk, night falls, then dawn wraps back to 0
+    if time_of_day < 0.55:
+        return 1
+    if time_of_day < 0.7:
+        return 0.5 + 0.5 * math.cos((time_of_day - 0.55) / 0.15 * math.pi)
+    if time_of_day < 0.9:
+        return 0
+    return 0.5 - 0.5 * math.cos((time_of_day - 0.9) / 0.1 * math.pi)
+
+def radial_gradient(radius):
+    """Greyscale disc, white at the centre fading to black at the edge."""
+    surf = pygame.Surface((radius * 2, radius * 2))
+    surf.fill('black')
+    for r in range(radius, 0, -1):
+        value = int(255 * (1 - r / radius))
+        pygame.draw.circle(surf, (value, value, value), (radius, radius), r)
+    return surf
+
+class Light:
+    def __init__(self, pos, radius, color):
+        self.rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        self.rect.center = pos
+
+        # Coloured falloff, built once
+        self.image = radial_gradient(radius)
+        self.image.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+
+class Lighting:
+    """Day/night tint looked up from a per-step table.
+
+    The light surface is only rebuilt when the quantized tint changes (or
+    the camera moves while a light is on screen); full daylight costs nothing.
+    """
+
+    def __init__(self, display_surface, steps=LIGHT_STEPS):
+        self.display_surface = display_surface
+        self.steps = steps
+
+        # Tint for every time-of-day step
+        self.overcast = 0
+        self.tints = [self.tint_at(step / steps) for step in range(steps)]
+        self.tint = DAY_COLOR
+
+        # Lights and the world-space light map they are baked into
+        self.lights = []
+        self.light_map = None
+        self.light_map_rect = None
+        self.light_map_tint = None
+
+        # Screen-space light surface and what it was last built for
+        self.light_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.built_for = None
+
+    def tint_at(self, time_of_day):
+        amount = daylight(time_of_day)
+        tint = (night + (day - night) * amount for day, night in zip(DAY_COLOR, NIGHT_COLOR))
+        return tuple(round(channel * (1 - self.overcast)) for channel in tint)
+
+    def set_overcast(self, overcast):
+        """Darken the sky by a fraction (0 is clear); rebuilds the tint table if it changed."""
+        if overcast != self.overcast:
+            self.overcast = overcast
+            self.tints = [self.tint_at(step / self.steps) for step in range(self.steps)]
+
+    def add_light(self, pos, radius, color=(255, 214, 150)):
+        """Add a warm glow at a world position (shown once it gets dark)."""
+        self.lights.append(Light(pos, radius, color))
+        self.light_map_tint = None
+
+    def bake_light_map(self):
+        """Composite every light over the current tint, once per tint step."""
+        self.light_map_rect = self.lights[0].rect.unionall([light.rect for light in self.lights[1:]])
+        self.light_map = pygame.Surface(self.light_map_rect.size)
+        self.light_map.fill(self.tint)
+        for light in self.lights:
+            pos = (light.rect.x - self.light_map_rect.x, light.rect.y - self.light_map_rect.y)
+            self.light_map.blit(light.image, pos, special_flags=pygame.BLEND_RGB_MAX)
+        self.light_map_tint = self.tint
+
+    def display(self, time_of_day, offset=(0, 0)):
+        self.tint = self.tints[int(time_of_day * self.steps) % self.steps]
+        if self.tint == DAY_COLOR:
+            return
+
+        # No light on screen: a single multiply fill, no extra surface
+        light_pos = None
+        if self.lights:
+            if self.light_map_tint != self.tint:
+                self.bake_light_map()
+            light_pos = (self.light_map_rect.x - int(offset[0]), self.light_map_rect.y - int(offset[1]))
+            if not self.light_map_rect.move(-int(offset[0]), -int(offset[1])).colliderect(self.light_surf.get_rect()):
+                light_pos = None
+        if light_pos is None:
+            self.display_surface.fill(self.tint, special_flags=pygame.BLEND_RGB_MULT)
+            return
+
+        if self.built_for != (self.tint, light_pos):
+            self.light_surf.fill(self.tint)
+            self.light_surf.blit(self.light_map, light_pos)
+            self.built_for = (self.tint, light_pos)
+        self.display_surface.blit(self.light_surf, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
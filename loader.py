@@ -0,0 +1,164 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame
+from atlas import CHARACTER_ANIMATIONS, folder_images
+from asset_cache import load_image, load_sound
+from profiling import profiler
+
+# Everything the level needs before its first frame
+STARTUP_ASSETS = {
+    'surfaces': [
+        'graphics/world/ground.png',
+        'graphics/fruit/apple.png',
+        'graphics/overlay/hoe.png',
+        'graphics/overlay/axe.png',
+        'graphics/overlay/water.png',
+        'graphics/overlay/corn.png',
+        'graphics/overlay/tomato.png',
+    ],
+    'frames': (
+        [f'graphics/character/{animation}' for animation in CHARACTER_ANIMATIONS] +
+        ['graphics/soil', 'graphics/soil_water', 'graphics/water', 'graphics/fruit/corn', 'graphics/fruit/tomato']
+    ),
+    'sounds': [
+        'graphics/axe.mp3',
+        'graphics/hoe.wav',
+        'graphics/water.mp3',
+    ],
+}
+
+def decode_image(path):
+    start = time.perf_counter()
+    surf = load_image(path)
+    return surf, time.perf_counter() - start
+
+def decode_sound(path):
+    start = time.perf_counter()
+    sound = load_sound(path)
+    return sound, time.perf_counter() - start
+
+class AssetLoader:
+    """Decodes startup images and sounds on a thread pool.
+
+    Worker threads only decode; the main thread does the final
+    convert_alpha and hands the results to the asset registry. The map is
+    not decoded here: Level.setup loads it on the main thread afterwards
+    (a compiled map load is a single read, see compiled_map). Phase
+    timings go to the startup profiler; report() adds per-file detail.
+    """
+
+    def __init__(self, registry, workers=None):
+        self.registry = registry
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 2)
+
+        # Per-file detail for the report
+        self.file_times = {}  # path -> decode seconds
+        self.failed = []
+
+    def jobs_for(self, surfaces=(), frames=(), sounds=()):
+        """List (kind, key, path) decode jobs for everything not loaded yet."""
+        jobs = []
+        for path in surfaces:
+            if not self.registry.is_loaded('surface', path):
+                jobs.append(('surface', path, path))
+
+        atlas = self.registry.get_atlas()
+        for folder in frames:
+            if self.registry.is_loaded('frames', folder):
+                continue
+            if atlas is not None and folder in atlas:
+                self.registry.frames(folder)  # Views into the already loaded atlas
+                continue
+            for path in folder_images(folder):
+                jobs.append(('frames', folder, path))
+
+        if pygame.mixer.get_init():
+            for path in sounds:
+                if not self.registry.is_loaded('sound', path):
+                    jobs.append(('sound', path, path))
+        return jobs
+
+    def load(self, surfaces=(), frames=(), sounds=(), progress=None):
+        """Load everything listed, calling progress(done, total) as files finish."""
+        with profiler.phase('atlas scan'):
+            jobs = self.jobs_for(surfaces, frames, sounds)
+
+        decoded = {}  # (kind, key, path) -> decoded asset
+        total = len(jobs)
+        if progress:
+            progress(0, total)
+
+        with profiler.phase(f'decode ({total} files, {self.workers} threads)'), \
+                ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(decode_sound if job[0] == 'sound' else decode_image, job[2]): job
+                for job in jobs
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                job = futures[future]
+                try:
+                    decoded[job], self.file_times[job[2]] = future.result()
+                except (pygame.error, OSError) as e:
+                    # Left for the registry to load (or report) on first use
+                    self.failed.append((job[2], str(e)))
+                if progress:
+                    progress(done, total)
+
+        # Main thread: convert to the display format and register
+        with profiler.phase('convert'):
+            self.register(jobs, decoded)
+
+    def register(self, jobs, decoded):
+        folders = {}
+        for kind, key, path in jobs:
+            asset = decoded.get((kind, key, path))
+            if asset is None:
+                continue
+            if kind == 'sound':
+                self.registry.add('sound', key, asset)
+            elif kind == 'surface':
+                self.registry.add('surface', key, asset.convert_alpha())
+            else:
+                folders.setdefault(key, []).append(asset.convert_alpha())
+        for folder, frames_list in folders.items():
+            if len(frames_list) == len(folder_images(folder)):
+                self.registry.add('frames', folder, frames_list)
+
+    def report(self, slowest=5):
+        lines = ["slowest files:"]
+        for path, seconds in sorted(self.file_times.items(), key=lambda item: -item[1])[:slowest]:
+            lines.append(f"  {seconds * 1000:>8.1f} ms  {path}")
+        for path, error in self.failed:
+            lines.append(f"failed: {path} ({error})")
+        return '\n'.join(lines)
+
+class LoadingScreen:
+    """Progress bar drawn straight to the window while assets load."""
+
+    def __init__(self, window):
+        self.window = window
+        self.font = pygame.font.SysFont('couriernew', 26)
+        self.label = 'Loading'
+
+    def draw(self, done, total):
+        width, height = self.window.get_size()
+        bar = pygame.Rect(0, 0, width // 2, 24)
+        bar.center = (width // 2, height // 2)
+        fill = bar.copy()
+        fill.width = int(bar.width * (done / total if total else 1))
+
+        self.window.fill('black')
+        pygame.draw.rect(self.window, (102, 204, 153), fill)
+        pygame.draw.rect(self.window, 'white', bar, 2)
+        text = self.font.render(f"{self.label}... {done}/{total}", True, 'white')
+        self.window.blit(text, text.get_rect(midbottom=(bar.centerx, bar.top - 10)))
+        pygame.display.flip()
+
+        # Keep the window responsive while loading
+        pygame.event.pump()
+
+    def show(self, label):
+        """Show a step that has no per-file progress."""
+        self.label = label
+        self.draw(0, 0)
@@ -1,67 +1,119 @@
+import sys
 import pygame
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_RATE, MAX_SIMULATION_STEPS
 from level1 import Level
+from presenter import Presenter
+from frame_pacer import FramePacer, FixedTimestep
+from text_cache import text_cache
+from assets import assets
+from loader import AssetLoader, LoadingScreen, STARTUP_ASSETS
+from profiling import profiler, DEFAULT_REPORT
+from savegame import save_farm, load_farm
 
 class Game:
     def __init__(self):
-        pygame.init()
+        with profiler.phase('pygame.init'):
+            pygame.init()
         # Set up resizable window
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-        pygame.display.set_caption("Byte Harvest")
-        self.clock = pygame.time.Clock()
+        with profiler.phase('window'):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+            pygame.display.set_caption("Byte Harvest")
+        self.pacer = FramePacer(60)
+        self.timestep = FixedTimestep(SIMULATION_RATE, MAX_SIMULATION_STEPS)
+
+        # Decode startup assets in parallel behind a loading screen
+        self.loader = AssetLoader(assets)
+        loading_screen = LoadingScreen(self.screen)
+        with profiler.phase('assets'):
+            self.loader.load(
+                surfaces=STARTUP_ASSETS['surfaces'],
+                frames=STARTUP_ASSETS['frames'],
+                sounds=STARTUP_ASSETS['sounds'],
+                progress=loading_screen.draw
+            )
 
         # Create farm surface (this stays at fixed size)
         self.farm_screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.level = Level(self.farm_screen)
+        loading_screen.show('Building level')
+        with profiler.phase('Level'):
+            self.level = Level(self.farm_screen)
+
+        # Pick the farm up where it was left, grown by the days it was closed
+        with profiler.phase('load_farm'):
+            days = load_farm(self.level)
+        if days:
+            print(f"Caught up {days} day(s) since the last session")
 
         # Store original dimensions
         self.original_width = SCREEN_WIDTH
         self.original_height = SCREEN_HEIGHT
 
+        # Copies farm_screen to the window, scaling only when the window is resized
+        self.presenter = Presenter(self.screen, self.farm_screen)
+
+        # Written only when requested with --profile-startup
+        profiler.finish()
+
     def handle_resize(self, event):
         new_width = max(event.w, SCREEN_WIDTH // 2)  # Don't allow too small
         new_height = max(event.h, SCREEN_HEIGHT // 2)
         self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
+        self.presenter.resize(self.screen)
+
+    def print_stats(self):
+        print(f"fps: {self.pacer.get_fps():.1f}")
+        print(self.timestep.report())
+        print(self.presenter.report())
+        print(f"camera: {self.level.all_sprites.stats}")
+        print(self.level.particle_pool.report())
+        print(self.level.weather.report())
+        print(text_cache.report())
+        print(assets.report())
+        print(profiler.summary())
+        print(self.loader.report())
 
     def run(self):
         running = True
         while running:
             # Event handling
-            event_list = pygame.event.get()
+            # Sleeps until the next visible change while only a static screen is shown
+            event_list = self.pacer.get_events(self.level.idle_timeout())
             for event in event_list:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
                     self.handle_resize(event)
+                # Developer keys (see README): scaler, stats, simulation speed
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                    print(f"Scaler: {self.presenter.next_mode()}")
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.print_stats()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    print(f"Simulation speed: {self.timestep.next_speed()}x")
 
             # Calculate delta time
-            dt = self.clock.tick(60) / 1000  # 60 FPS
-
-            # Update level
-            self.level.run(dt, event_list)
-
-            # Scale farm_screen to fit current window size while maintaining aspect ratio
-            current_size = self.screen.get_size()
-            scale_factor = min(current_size[0] / SCREEN_WIDTH, 
-                               current_size[1] / SCREEN_HEIGHT)
-            
-            scaled_width = int(SCREEN_WIDTH * scale_factor)
-            scaled_height = int(SCREEN_HEIGHT * scale_factor)
-            
-            # Center the scaled surface
-            x_offset = (current_size[0] - scaled_width) // 2
-            y_offset = (current_size[1] - scaled_height) // 2
-            
-            # Scale and draw farm screen
-            scaled_surface = pygame.transform.smoothscale(self.farm_screen, 
-                                                          (scaled_width, scaled_height))
-            self.screen.fill('black')  # Fill with black to cover empty space
-            self.screen.blit(scaled_surface, (x_offset, y_offset))
-            
+            dt = self.pacer.tick()  # 60 FPS unless idle
+
+            # Update the level in fixed steps, then draw between the last two
+            if self.level.begin_frame(event_list):
+                for _ in range(self.timestep.advance(dt)):
+                    self.level.update(self.timestep.step)
+                self.level.draw(self.timestep.alpha)
+            else:
+                self.timestep.reset()
+
+            # Draw farm_screen to the window (letterboxed if resized)
+            self.presenter.present()
+
             pygame.display.flip()
 
+        save_farm(self.level)
         pygame.quit()
 
 if __name__ == '__main__':
+    # python main.py --profile-startup [report.json]
+    if '--profile-startup' in sys.argv:
+        args = sys.argv[sys.argv.index('--profile-startup') + 1:]
+        profiler.enable(args[0] if args and not args[0].startswith('-') else DEFAULT_REPORT)
     game = Game()
     game.run()
@@ -1,6 +1,7 @@
 import pygame
 from constants import *
 from timer_byte import Timer
+from text_cache import text_cache
 
 class Menu:
     def __init__(self, player, toggle_menu, farm_screen):
@@ -9,6 +10,7 @@ class Menu:
         self.toggle_menu = toggle_menu
         self.farm_screen = farm_screen
         self.font = pygame.font.SysFont('couriernew', 26)
+        self.action_font = pygame.font.SysFont('couriernew', 22)
         
         # Menu spacing
         self.padding = 30
@@ -57,7 +59,7 @@ class Menu:
 
     def display_money(self):
         text = f"Money: {self.player.money}"
-        money_surf = self.font.render(text, True, 'black', 'white')
+        money_surf = text_cache.render(self.font, text, True, 'black', 'white')
         money_rect = money_surf.get_rect(center=(SCREEN_WIDTH // 2, FARM_HEIGHT - 50))
         self.farm_screen.blit(money_surf, money_rect)
 
@@ -69,26 +71,26 @@ class Menu:
         pygame.draw.rect(self.farm_screen, 'blue', inventory_bg, 2)
 
         # Items header
-        header_text = self.font.render('Items: ', True, 'black', 'white')
+        header_text = text_cache.render(self.font, 'Items: ', True, 'black', 'white')
         header_rect = header_text.get_rect(left=left - 50, top=FARM_HEIGHT // 6)
         self.farm_screen.blit(header_text, header_rect)
 
         # Display items
         for i, (item, count) in enumerate(self.player.item_inventory.items()):
             text = f"{item}: {count}"
-            item_surf = self.font.render(text, True, 'black', 'white')
+            item_surf = text_cache.render(self.font, text, True, 'black', 'white')
             item_rect = item_surf.get_rect(left=left, top=FARM_HEIGHT // 4 + (30 * i))
             self.farm_screen.blit(item_surf, item_rect)
 
         # Seeds header
-        seed_header = self.font.render('Seeds: ', True, 'black', 'white')
+        seed_header = text_cache.render(self.font, 'Seeds: ', True, 'black', 'white')
         seed_header_rect = seed_header.get_rect(left=left - 50, top=FARM_HEIGHT // 2 + 20)
         self.farm_screen.blit(seed_header, seed_header_rect)
 
         # Display seeds
         for i, (seed, count) in enumerate(self.player.seed_inventory.items(), 1):
             text = f"{seed}: {count}"
-            seed_surf = self.font.render(text, True, 'black', 'white')
+            seed_surf = text_cache.render(self.font, text, True, 'black', 'white')
             seed_rect = seed_surf.get_rect(left=left, top=FARM_HEIGHT // 2 + 20 + (30 * i))
             self.farm_screen.blit(seed_surf, seed_rect)
 
@@ -104,9 +106,8 @@ class Menu:
                 pygame.draw.rect(self.farm_screen, 'black', border_rect, 3)
 
                 # Show BUY/SELL text
-                action_font = pygame.font.SysFont('couriernew', 22)
                 action_text = "SELL" if i < self.num_sellable else "BUY"
-                action_surf = action_font.render(action_text, True, 'black')
+                action_surf = text_cache.render(self.action_font, action_text, True, 'black')
                 action_rect = action_surf.get_rect(center=border_rect.center)
                 self.farm_screen.blit(action_surf, action_rect)
 
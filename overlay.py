@@ -1,5 +1,6 @@
 import pygame
 from constants import *
+from assets import assets
 
 
 
@@ -11,9 +12,9 @@ class Overlay:
 
         # Load overlay images
         overlay_path = "graphics/overlay/"
-        self.tools_surf = {tool: pygame.image.load(f"{overlay_path}{tool}.png").convert_alpha() 
+        self.tools_surf = {tool: assets.surface(f"{overlay_path}{tool}.png")
                           for tool in player.tools}
-        self.seeds_surf = {seed: pygame.image.load(f"{overlay_path}{seed}.png").convert_alpha() 
+        self.seeds_surf = {seed: assets.surface(f"{overlay_path}{seed}.png")
                           for seed in player.seeds}
 
     def display(self):
@@ -1,10 +1,10 @@
 import pygame
 from constants import *
-from support import import_folder
+from assets import assets
 from timer_byte import Timer
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, pos, group, collision_sprites, tree_sprites, interaction_sprites, soil_layer, toggle_shop):
+    def __init__(self, pos, group, collision_sprites, collision_tiles, tree_sprites, interaction_sprites, soil_layer, toggle_shop):
         super().__init__(group)
 
         # Animation setup
@@ -25,6 +25,7 @@ class Player(pygame.sprite.Sprite):
         # Collision
         self.hitbox = self.rect.copy().inflate(-30, -50)  # Adjusted hitbox size
         self.collision_sprites = collision_sprites
+        self.collision_tiles = collision_tiles  # Static blocking tiles (TileBitmap)
 
         # Timers
         self.timers = {
@@ -70,7 +71,7 @@ class Player(pygame.sprite.Sprite):
 
         # Sound
         try:
-            self.watering = pygame.mixer.Sound('graphics/water.mp3')
+            self.watering = assets.sound('graphics/water.mp3')
             self.watering.set_volume(0.2)
         except:
             print("Water sound not found")
@@ -84,9 +85,10 @@ class Player(pygame.sprite.Sprite):
             'up_water': [], 'down_water': [], 'left_water': [], 'right_water': []
         }
 
+        # Frames come from the packed atlas when available (see atlas.py)
         for animation in self.animations.keys():
             full_path = f'graphics/character/{animation}'
-            self.animations[animation] = import_folder(full_path)
+            self.animations[animation] = assets.frames(full_path)
 
     def animate(self, dt):
         self.frame_index += 4 * dt
@@ -168,24 +170,29 @@ class Player(pygame.sprite.Sprite):
             self.status = self.status.split('_')[0] + '_' + self.selected_tool
 
     def collision(self, direction):
-        for sprite in self.collision_sprites.sprites():
+        # Static tiles first, then sprites near the player (hitboxes sit inside rects)
+        hitboxes = self.collision_tiles.hitboxes(self.hitbox)
+        for sprite in self.collision_sprites.query(self.hitbox):
             if hasattr(sprite, 'hitbox'):
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if direction == 'horizontal':
-                        if self.direction.x > 0:  # Moving right
-                            self.hitbox.right = sprite.hitbox.left
-                        if self.direction.x < 0:  # Moving left
-                            self.hitbox.left = sprite.hitbox.right
-                        self.rect.centerx = self.hitbox.centerx
-                        self.pos.x = self.hitbox.centerx
-
-                    if direction == 'vertical':
-                        if self.direction.y > 0:  # Moving down
-                            self.hitbox.bottom = sprite.hitbox.top
-                        if self.direction.y < 0:  # Moving up
-                            self.hitbox.top = sprite.hitbox.bottom
-                        self.rect.centery = self.hitbox.centery
-                        self.pos.y = self.hitbox.centery
+                hitboxes.append(sprite.hitbox)
+
+        for hitbox in hitboxes:
+            if hitbox.colliderect(self.hitbox):
+                if direction == 'horizontal':
+                    if self.direction.x > 0:  # Moving right
+                        self.hitbox.right = hitbox.left
+                    if self.direction.x < 0:  # Moving left
+                        self.hitbox.left = hitbox.right
+                    self.rect.centerx = self.hitbox.centerx
+                    self.pos.x = self.hitbox.centerx
+
+                if direction == 'vertical':
+                    if self.direction.y > 0:  # Moving down
+                        self.hitbox.bottom = hitbox.top
+                    if self.direction.y < 0:  # Moving up
+                        self.hitbox.top = hitbox.bottom
+                    self.rect.centery = self.hitbox.centery
+                    self.pos.y = self.hitbox.centery
 
     def move(self, dt):
         if not self.can_move:
@@ -210,9 +217,8 @@ class Player(pygame.sprite.Sprite):
         if self.selected_tool == 'hoe':
             self.soil_layer.get_hit(self.target_pos)
         if self.selected_tool == 'axe':
-            for tree in self.tree_sprites.sprites():
-                if tree.rect.collidepoint(self.target_pos):
-                    tree.damage()
+            for tree in self.tree_sprites.query_point(self.target_pos):
+                tree.damage()
         if self.selected_tool == 'water':
             self.soil_layer.water(self.target_pos)
             self.watering.play()
@@ -3,6 +3,7 @@ import pygame
 import datetime
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from SoilLayer import SoilLayer
+from text_cache import text_cache
 
 class Pomodoro:
     def __init__(self, display_surface, soil_layer):
@@ -92,7 +93,7 @@ class Pomodoro:
 
         # Title
         title = "Pomodoro Timer Setup"
-        title_surf = self.title_font.render(title, True, self.text_color)
+        title_surf = text_cache.render(self.title_font, title, True, self.text_color)
         title_rect = title_surf.get_rect(center=(current_width/2, current_height/4))
 
         # Prompt based on input stage
@@ -103,13 +104,13 @@ class Pomodoro:
         else:
             prompt = "Enter number of sequences:"
 
-        prompt_surf = self.font.render(prompt, True, self.text_color)
+        prompt_surf = text_cache.render(self.font, prompt, True, self.text_color)
         prompt_rect = prompt_surf.get_rect(center=(current_width/2, current_height/2 - 50))
 
         # Input text with blinking cursor
         cursor = "█" if pygame.time.get_ticks() % 1000 < 500 else " "
         input_text = self.current_input + cursor
-        input_surf = self.font.render(input_text, True, self.work_color if self.input_stage == 'work' else self.break_color)
+        input_surf = text_cache.render(self.font, input_text, True, self.work_color if self.input_stage == 'work' else self.break_color)
         input_rect = input_surf.get_rect(center=(current_width/2, current_height/2 + 50))
 
         # Draw elements
@@ -120,7 +121,7 @@ class Pomodoro:
         # Draw instructions
         instructions = ["Press ENTER to confirm", "Press ESC to exit"]
         for i, instruction in enumerate(instructions):
-            inst_surf = self.info_font.render(instruction, True, (200, 200, 200))
+            inst_surf = text_cache.render(self.info_font, instruction, True, (200, 200, 200))
             inst_rect = inst_surf.get_rect(center=(current_width/2, current_height*3/4 + i*40))
             self.display_surface.blit(inst_surf, inst_rect)
 
@@ -134,7 +135,7 @@ class Pomodoro:
             
             # Draw "Focus Time!"
             focus_text = "Focus Time!"
-            focus_surf = self.title_font.render(focus_text, True, self.work_color)
+            focus_surf = text_cache.render(self.title_font, focus_text, True, self.work_color)
             focus_rect = focus_surf.get_rect(center=(current_width/2, current_height/4))
             self.display_surface.blit(focus_surf, focus_rect)
             
@@ -144,7 +145,7 @@ class Pomodoro:
             seconds = int(remaining.total_seconds() % 60)
             timer_text = f"{minutes:02d}:{seconds:02d}"
             
-            timer_surf = self.font.render(timer_text, True, self.text_color)
+            timer_surf = text_cache.render(self.font, timer_text, True, self.text_color)
             timer_rect = timer_surf.get_rect(center=(current_width/2, current_height/2))
             
             # Draw box around timer
@@ -156,7 +157,7 @@ class Pomodoro:
             
             # Draw sequence counter
             sequence_text = f"Sequence {self.current_sequence}/{self.total_sequences}"
-            sequence_surf = self.info_font.render(sequence_text, True, self.text_color)
+            sequence_surf = text_cache.render(self.info_font, sequence_text, True, self.text_color)
             sequence_rect = sequence_surf.get_rect(center=(current_width/2, current_height*3/4))
             self.display_surface.blit(sequence_surf, sequence_rect)
             
@@ -168,7 +169,7 @@ class Pomodoro:
             timer_text = f"Break Time: {minutes:02d}:{seconds:02d}"
             
             # Create a semi-transparent background for the break timer
-            timer_surf = self.font.render(timer_text, True, self.break_color)
+            timer_surf = text_cache.render(self.font, timer_text, True, self.break_color)
             timer_rect = timer_surf.get_rect()
             timer_rect.topleft = (20, 20)  # Position in top-left corner
             
@@ -183,6 +184,18 @@ class Pomodoro:
             
             self.display_surface.blit(timer_surf, timer_rect)
 
+    def idle_timeout(self):
+        """Milliseconds until the full-screen work panel next changes, or None during a break."""
+        if not self.working:
+            return None
+        if self.collecting_input:
+            # Cursor blinks every 500 ms
+            return 500 - pygame.time.get_ticks() % 500
+
+        # The countdown only changes when a whole second passes
+        remaining = (self.end_time - datetime.datetime.now()).total_seconds()
+        return int((remaining % 1) * 1000) + 1
+
     def draw(self):
         if self.collecting_input:
             self.draw_input_screen()
@@ -0,0 +1,46 @@
+class Pooled:
+    """Mixin for sprites a SpritePool can recycle.
+
+    Per-use state is set in reset(**kwargs), which __init__ should call too,
+    and the sprite calls expire() instead of kill() when it is done.
+    """
+    pool = None
+
+    def expire(self):
+        if self.pool:
+            self.pool.release(self)
+        else:
+            self.kill()
+
+class SpritePool:
+    """Keeps expired sprites of one class to hand out again instead of building new ones."""
+
+    def __init__(self, sprite_class, groups, max_size=1024):
+        self.sprite_class = sprite_class
+        self.groups = groups  # Every sprite from this pool joins these groups
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, **kwargs):
+        """A sprite reset with kwargs (same arguments as the class, minus groups)."""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(**kwargs)
+            sprite.add(*self.groups)
+            self.reused += 1
+        else:
+            sprite = self.sprite_class(groups=self.groups, **kwargs)
+            sprite.pool = self
+            self.created += 1
+        return sprite
+
+    def release(self, sprite):
+        sprite.kill()
+        if len(self.free) < self.max_size:
+            self.free.append(sprite)
+
+    def report(self):
+        name = self.sprite_class.__name__
+        return f"{name} pool: {self.created} created, {self.reused} reused, {len(self.free)} free"
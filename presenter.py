@@ -0,0 +1,62 @@
+import pygame
+import time
+
+class Presenter:
+    """Copies the fixed-size farm screen onto the (resizable) window."""
+
+    # Scalers used when the window is not at native size
+    MODES = ('smooth', 'nearest', 'integer')
+
+    def __init__(self, window, source, mode='smooth'):
+        self.source = source
+        self.mode = mode
+
+        # Timing (milliseconds)
+        self.last_ms = 0
+        self.average_ms = 0
+
+        self.resize(window)
+
+    def resize(self, window):
+        """Recompute the letterbox geometry. Only needed when the window changes."""
+        self.window = window
+        window_w, window_h = window.get_size()
+        source_w, source_h = self.source.get_size()
+
+        scale = min(window_w / source_w, window_h / source_h)
+        if self.mode == 'integer' and scale >= 1:
+            scale = int(scale)
+
+        size = (max(1, int(source_w * scale)), max(1, int(source_h * scale)))
+        self.rect = pygame.Rect((0, 0), size)
+        self.rect.center = (window_w // 2, window_h // 2)
+        self.native = self.rect.size == (source_w, source_h)
+
+        # Scaled frames are written straight into the window area they cover
+        self.target = None if self.native else window.subsurface(self.rect)
+        window.fill('black')  # Letterbox bars stay black until the next resize
+
+    def set_mode(self, mode):
+        self.mode = mode
+        self.resize(self.window)
+
+    def next_mode(self):
+        self.set_mode(self.MODES[(self.MODES.index(self.mode) + 1) % len(self.MODES)])
+        return self.mode
+
+    def present(self):
+        """Draw the source onto the window and record how long it took."""
+        start = time.perf_counter()
+
+        if self.native:
+            self.window.blit(self.source, self.rect)
+        elif self.mode == 'smooth':
+            pygame.transform.smoothscale(self.source, self.rect.size, self.target)
+        else:
+            pygame.transform.scale(self.source, self.rect.size, self.target)
+
+        self.last_ms = (time.perf_counter() - start) * 1000
+        self.average_ms += (self.last_ms - self.average_ms) * 0.05
+
+    def report(self):
+        return f"present [{self.mode}] {self.rect.width}x{self.rect.height}: {self.average_ms:.2f} ms avg, {self.last_ms:.2f} ms last"
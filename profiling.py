@@ -0,0 +1,99 @@
+import gc
+import json
+import platform
+import time
+from contextlib import contextmanager
+import pygame
+
+DEFAULT_REPORT = 'startup_profile.json'
+
+def live_objects():
+    """Sprites and surfaces currently alive, keyed by id. Slow: walks the whole heap."""
+    tracked = gc.get_objects()
+    sprites = {id(obj): obj for obj in tracked if isinstance(obj, pygame.sprite.Sprite)}
+    # Surfaces are not tracked by gc themselves, so look at what tracked objects refer to
+    surfaces = {id(obj): obj for obj in gc.get_referents(*tracked) if isinstance(obj, pygame.Surface)}
+    return sprites, surfaces
+
+def surface_bytes(surfaces):
+    """Pixel memory held by surfaces; subsurfaces share their parent's pixels and are skipped."""
+    return sum(surf.get_pitch() * surf.get_height() for surf in surfaces if surf.get_parent() is None)
+
+class StartupProfiler:
+    """The one timer for startup phases; when enabled it also counts what each allocated.
+
+    Phases can nest (e.g. 'Level/setup_house'). Timing is always on and
+    summarised by summary(). Counting sprites and surfaces walks the heap,
+    so it only happens when a report has been requested with enable().
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.report_path = None
+        self.phases = []
+        self.stack = []
+        self.start = time.perf_counter()
+
+    def enable(self, report_path=DEFAULT_REPORT):
+        self.enabled = True
+        self.report_path = report_path
+
+    @contextmanager
+    def phase(self, name):
+        self.stack.append(name)
+        entry = {'phase': '/'.join(self.stack), 'depth': len(self.stack) - 1}
+        self.phases.append(entry)  # Listed in start order; filled in when the phase ends
+        before = live_objects() if self.enabled else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry['ms'] = round((time.perf_counter() - start) * 1000, 3)
+            if self.enabled:
+                sprites, surfaces = live_objects()
+                new_surfaces = [surf for key, surf in surfaces.items() if key not in before[1]]
+                entry['sprites_created'] = len(sprites.keys() - before[0].keys())
+                entry['surfaces_created'] = len(new_surfaces)
+                entry['surface_bytes_created'] = surface_bytes(new_surfaces)
+            self.stack.pop()
+
+    def total_ms(self):
+        """Time spent in top-level phases."""
+        return sum(entry.get('ms', 0) for entry in self.phases if entry['depth'] == 0)
+
+    def summary(self, max_depth=1):
+        """Phase timings as text for the console."""
+        lines = [f"startup: {self.total_ms():.0f} ms"]
+        for entry in self.phases:
+            if entry['depth'] <= max_depth and 'ms' in entry:
+                name = '  ' * entry['depth'] + entry['phase'].rsplit('/', 1)[-1]
+                lines.append(f"  {name:<40} {entry['ms']:>8.1f} ms")
+        return '\n'.join(lines)
+
+    def report(self):
+        report = {
+            'total_ms': round((time.perf_counter() - self.start) * 1000, 3),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'phases': self.phases,
+        }
+        if self.enabled:
+            sprites, surfaces = live_objects()
+            report['sprites_alive'] = len(sprites)
+            report['surfaces_alive'] = len(surfaces)
+            report['surface_bytes_alive'] = surface_bytes(surfaces.values())
+        return report
+
+    def finish(self):
+        """Write the JSON report if one was requested. Returns the report path or None."""
+        if not self.enabled:
+            return None
+        with open(self.report_path, 'w') as file:
+            json.dump(self.report(), file, indent=2)
+        print(f"Startup profile written to {self.report_path}")
+        return self.report_path
+
+# Shared by Game and Level
+profiler = StartupProfiler()
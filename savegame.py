@@ -0,0 +1,71 @@
+"""Farm save file, with catch-up for the time the game was closed.
+
+The save holds the soil flags, every crop's columns, the day number and
+weather seed, and the wall-clock time it was written. On load, the game
+days that passed since then are applied in one SoilLayer.catch_up call,
+with the rain for those days read from the weather schedule.
+
+While the game runs, a day only ends by sleeping or at the end of a
+work phase. While it is closed, one game day passes per
+OFFLINE_DAY_LENGTH of real time (one real day), and time left over
+from a partial day is dropped. The time of day on the day clock
+resumes where it was saved.
+
+Only the farm is saved. The player's position and inventory, the trees
+and the Pomodoro timer start fresh on every launch.
+"""
+import os
+import time
+import numpy as np
+from constants import OFFLINE_DAY_LENGTH
+from weather import WeatherSchedule
+
+SAVE_PATH = os.path.join('saves', 'farm.npz')
+VERSION = 1
+
+CROP_COLUMNS = ('kind', 'age', 'grow_speed', 'col', 'row')
+
+def save_farm(level, path=SAVE_PATH):
+    soil_layer = level.soil_layer
+    crops = soil_layer.crops
+    columns = {f'crop_{name}': getattr(crops, name)[:len(crops)] for name in CROP_COLUMNS}
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f'{path}.tmp.npz'
+    np.savez_compressed(
+        temp,
+        version=VERSION,
+        saved_at=time.time(),
+        time_of_day=level.sky.time_of_day,
+        day=level.day,
+        weather_seed=level.schedule.seed,
+        grid=soil_layer.grid,
+        **columns
+    )
+    os.replace(temp, path)
+
+def elapsed_days(seconds):
+    """Whole game days that pass in seconds of real time with the game closed."""
+    return int(max(0, seconds) // OFFLINE_DAY_LENGTH)
+
+def load_farm(level, path=SAVE_PATH, now=None):
+    """Restore the farm and catch up on the days that passed. Returns the day count, or None."""
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        if int(data['version']) != VERSION or data['grid'].shape != level.soil_layer.grid.shape:
+            print(f"Ignoring incompatible save {path}")
+            return None
+        soil_layer = level.soil_layer
+        soil_layer.restore(data['grid'], {name: data[f'crop_{name}'] for name in CROP_COLUMNS})
+        level.schedule = WeatherSchedule(int(data['weather_seed']))
+        saved_day = int(data['day'])
+
+        days = elapsed_days((now or time.time()) - float(data['saved_at']))
+        level.sky.time_of_day = float(data['time_of_day'])
+
+    # Rollover d of the catch-up starts day saved_day + d + 1
+    soil_layer.catch_up(days, level.schedule.rainy(saved_day + 1, days))
+    level.day = saved_day + days
+    level.apply_weather()
+    return days
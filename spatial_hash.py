@@ -0,0 +1,140 @@
+import pygame
+
+
+class SpatialHash:
+    """Uniform grid that buckets sprites by the cells their rect overlaps."""
+
+    def __init__(self, cell_size=256, key=None):
+        self.cell_size = cell_size
+        self.key = key or (lambda sprite: sprite.rect)
+
+        # cell (col, row) -> set of sprites
+        self.cells = {}
+        # sprite -> (rect tuple it was indexed with, cells it occupies)
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, sprite):
+        return sprite in self.entries
+
+    def cells_for(self, rect):
+        """Return every cell a rect overlaps."""
+        size = self.cell_size
+        left = int(rect[0]) // size
+        top = int(rect[1]) // size
+        right = (int(rect[0] + rect[2]) - 1) // size
+        bottom = (int(rect[1] + rect[3]) - 1) // size
+        return [(col, row)
+                for row in range(top, max(top, bottom) + 1)
+                for col in range(left, max(left, right) + 1)]
+
+    def insert(self, sprite):
+        """Index a sprite under its current rect."""
+        if sprite in self.entries:
+            self.remove(sprite)
+        rect = self.key(sprite)
+        cells = self.cells_for(rect)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(sprite)
+        self.entries[sprite] = (tuple(rect), cells)
+
+    def remove(self, sprite):
+        """Drop a sprite from the index (no-op if it is not indexed)."""
+        entry = self.entries.pop(sprite, None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.discard(sprite)
+                if not bucket:
+                    del self.cells[cell]
+
+    def move(self, sprite):
+        """Re-index a sprite if its rect changed. Returns True if it did."""
+        entry = self.entries.get(sprite)
+        if entry is None:
+            return False
+        rect = self.key(sprite)
+        if tuple(rect) == entry[0]:
+            return False
+        cells = self.cells_for(rect)
+        if cells != entry[1]:
+            self.remove(sprite)
+            for cell in cells:
+                self.cells.setdefault(cell, set()).add(sprite)
+        self.entries[sprite] = (tuple(rect), cells)
+        return True
+
+    def query(self, rect):
+        """Return the sprites whose indexed rect overlaps the given rect."""
+        rect = pygame.Rect(rect)
+        found = set()
+        for cell in self.cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return {sprite for sprite in found if rect.colliderect(self.key(sprite))}
+
+    def query_point(self, point):
+        """Return the sprites whose indexed rect contains the given point."""
+        size = self.cell_size
+        bucket = self.cells.get((int(point[0]) // size, int(point[1]) // size), ())
+        return {sprite for sprite in bucket if self.key(sprite).collidepoint(point)}
+
+def moved(sprite):
+    """Tell every group of a sprite that indexes by rect that its rect changed."""
+    for group in sprite.groups():
+        if hasattr(group, 'move'):
+            group.move(sprite)
+
+class SpatialGroup(pygame.sprite.Group):
+    """Sprite group that also keeps its members in a SpatialHash.
+
+    Members are indexed lazily on the first query after they are added, since
+    sprites set their rect after joining their groups. Query results come back
+    in insertion order, the same order iterating the group would give.
+    """
+
+    def __init__(self, *sprites, cell_size=256, key=None):
+        self.spatial_index = SpatialHash(cell_size, key)
+        self.pending = set()  # Added sprites not indexed yet
+        self.sequence = {}  # sprite -> insertion number
+        self.next_sequence = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.sequence[sprite] = self.next_sequence
+        self.next_sequence += 1
+        self.pending.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.pending.discard(sprite)
+        self.spatial_index.remove(sprite)
+        self.sequence.pop(sprite, None)
+
+    def move(self, sprite):
+        """Re-index a member whose rect changed. Returns True if it did."""
+        return self.spatial_index.move(sprite)
+
+    def refresh_index(self):
+        for sprite in self.pending:
+            self.spatial_index.insert(sprite)
+        self.pending.clear()
+
+    def ordered(self, sprites):
+        return sorted(sprites, key=self.sequence.__getitem__)
+
+    def query(self, rect):
+        """Members whose indexed rect overlaps rect, in insertion order."""
+        self.refresh_index()
+        return self.ordered(self.spatial_index.query(rect))
+
+    def query_point(self, point):
+        """Members whose indexed rect contains point, in insertion order."""
+        self.refresh_index()
+        return self.ordered(self.spatial_index.query_point(point))
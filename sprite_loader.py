@@ -17,20 +17,14 @@ def load_spritesheet(path, frame_width, frame_height):
         # Create empty list for frames
         frames = []
 
-        # Cut up the spritesheet into individual frames
+        # Cut up the spritesheet into individual frames (views, no pixel copies)
         for col in range(cols):
-            # Create surface for the frame
-            frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-
-            # Copy the frame from the sheet
-            frame.blit(sheet, (0, 0),
-                      (col * frame_width, 0, frame_width, frame_height))
-
+            frame = sheet.subsurface((col * frame_width, 0, frame_width, frame_height))
             frames.append(frame)
 
         return frames
 
-    except (pygame.error, FileNotFoundError) as e:
+    except (pygame.error, FileNotFoundError, ValueError) as e:
         print(f"Failed to load spritesheet: {path}")
         print(f"Error: {str(e)}")
 
@@ -1,9 +1,24 @@
 
 
 import pygame
+import weakref
 from constants import LAYERS, TILE_SIZE, APPLE_POS
 from random import randint, choice
 from sprite_loader import import_folder
+from assets import assets
+from pool import Pooled
+
+# Source surface -> white silhouette, shared by every particle made from it
+SILHOUETTES = weakref.WeakKeyDictionary()
+
+def silhouette(surf):
+    """White, colorkeyed silhouette of a surface (cached per surface)."""
+    image = SILHOUETTES.get(surf)
+    if image is None:
+        image = pygame.mask.from_surface(surf).to_surface()
+        image.set_colorkey((0, 0, 0))
+        SILHOUETTES[surf] = image
+    return image
 
 class Terrain(pygame.sprite.Sprite):
     def __init__(self, pos, surf, groups, z=LAYERS['main']):
@@ -17,21 +32,6 @@ class Terrain(pygame.sprite.Sprite):
         shrink_y = self.rect.height * 0.75
         self.hitbox = self.rect.copy().inflate(-shrink_x, -shrink_y)
 
-class WaterTile(pygame.sprite.Sprite):
-    def __init__(self, pos, frames, groups):
-        super().__init__(groups)
-        self.frames = frames
-        self.frame_index = 0
-        self.image = self.frames[self.frame_index]
-        self.rect = self.image.get_rect(topleft=pos)
-        self.z = LAYERS['water']
-
-    def update(self, dt):
-        self.frame_index += 5 * dt
-        if self.frame_index >= len(self.frames):
-            self.frame_index = 0
-        self.image = self.frames[int(self.frame_index)]
-
 class WildFlower(pygame.sprite.Sprite):
     def __init__(self, pos, surf, groups):
         super().__init__(groups)
@@ -57,13 +57,13 @@ class Tree(pygame.sprite.Sprite):
         self.player_add = player_add  # Reference to player_add function for inventory management
 
         # Apples
-        self.apple_surf = pygame.image.load('graphics/fruit/apple.png').convert_alpha()
+        self.apple_surf = assets.surface('graphics/fruit/apple.png')
         self.apple_pos = APPLE_POS.get(name, [])  # Get apple positions for this tree type
         self.apple_sprites = pygame.sprite.Group()
         self.create_fruit()
 
         # Sounds
-        self.axe_sound = pygame.mixer.Sound('graphics/axe.mp3')
+        self.axe_sound = assets.sound('graphics/axe.mp3')
 
     def create_fruit(self):
         """Create apples on the tree at predefined positions."""
@@ -117,29 +117,26 @@ class Fruit(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=pos)
         self.z = z
 
-class Particle(pygame.sprite.Sprite):
+class Particle(Pooled, pygame.sprite.Sprite):
     def __init__(self, pos, surf, groups, z, duration=200):
         super().__init__(groups)
+        self.reset(pos, surf, z, duration)
+
+    def reset(self, pos, surf, z, duration=200):
         self.z = z
 
-        # Basic setup
-        self.image = surf
+        # Fade effect
+        self.image = silhouette(surf)
         self.rect = self.image.get_rect(topleft=pos)
 
         # Animation
         self.start_time = pygame.time.get_ticks()
         self.duration = duration
 
-        # Fade effect
-        mask_surf = pygame.mask.from_surface(self.image)
-        new_surf = mask_surf.to_surface()
-        new_surf.set_colorkey((0, 0, 0))
-        self.image = new_surf
-
     def update(self, dt):
         current_time = pygame.time.get_ticks()
         if current_time - self.start_time > self.duration:
-            self.kill()
+            self.expire()
 
 class Interaction(pygame.sprite.Sprite):
     def __init__(self, pos, size, groups, name):
@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Headless pygame, and the game's modules live at the repository root
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+@pytest.fixture(scope='session', autouse=True)
+def display():
+    pygame.init()
+    yield pygame.display.set_mode((1, 1))
+    pygame.quit()
+
+# Soil grid used by the farm tests, in tiles
+FIELD_COLS, FIELD_ROWS = 10, 8
+
+@pytest.fixture
+def soil_layer(display):
+    """A SoilLayer on a small all-farmable field, with plain surfaces for its art."""
+    from constants import TILE_SIZE
+    from assets import assets
+    from spatial_hash import SpatialGroup
+    from tile_bitmap import TileBitmap
+    from SoilLayer import SoilLayer
+
+    tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    assets.add('surface', 'graphics/world/ground.png', pygame.Surface((FIELD_COLS * TILE_SIZE, FIELD_ROWS * TILE_SIZE)))
+    for folder in ('graphics/soil', 'graphics/soil_water', 'graphics/fruit/corn', 'graphics/fruit/tomato'):
+        assets.add('frames', folder, [tile] * 4)
+    if pygame.mixer.get_init():
+        assets.add('sound', 'graphics/hoe.wav', pygame.mixer.Sound(buffer=bytes(64)))
+
+    soil = SoilLayer(pygame.sprite.Group(), SpatialGroup(cell_size=4 * TILE_SIZE))
+    soil.farmable = TileBitmap(FIELD_COLS, FIELD_ROWS, b'\x01' * (FIELD_COLS * FIELD_ROWS))
+    return soil
@@ -0,0 +1,56 @@
+import random
+import pygame
+from constants import LAYERS, SCREEN_WIDTH, SCREEN_HEIGHT
+from cameraGroup import CameraGroup
+from spatial_hash import moved
+
+class Block(pygame.sprite.Sprite):
+    def __init__(self, pos, groups, z=LAYERS['main']):
+        super().__init__(groups)
+        self.image = pygame.Surface((16, 32))
+        self.rect = self.image.get_rect(topleft=pos)
+        self.z = z
+
+def refresh(group):
+    group.refresh_index()
+    group.refresh_order()
+
+def assert_consistent(group):
+    for z, bucket in group.buckets.items():
+        assert bucket == sorted((sprite for sprite in group if sprite.z == z), key=group.sort_key)
+    for sprite in group:
+        assert group.spatial_index.entries[sprite][0] == tuple(sprite.rect)
+
+def test_only_moving_sprites_are_reordered():
+    rng = random.Random(1)
+    group = CameraGroup(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    still = [Block((rng.randrange(2000), rng.randrange(2000)), [group]) for _ in range(200)]
+    ground = [Block((rng.randrange(2000), rng.randrange(2000)), [group], LAYERS['ground']) for _ in range(50)]
+    walkers = [Block((rng.randrange(2000), rng.randrange(2000)), [group]) for _ in range(10)]
+    for walker in walkers:
+        group.interpolate(walker)
+    refresh(group)
+    assert_consistent(group)
+
+    for frame in range(100):
+        for walker in walkers:
+            walker.rect.move_ip(rng.randint(-20, 20), rng.randint(-20, 20))
+        if frame % 10 == 0:
+            # A still sprite changing its rect has to say so
+            sprite = rng.choice(still)
+            sprite.rect.height += 8
+            moved(sprite)
+        if frame % 15 == 0:
+            rng.choice(still + ground).kill()
+            Block((rng.randrange(2000), rng.randrange(2000)), [group])
+        refresh(group)
+        assert_consistent(group)
+
+def test_still_sprites_are_reindexed_only_when_reported():
+    group = CameraGroup(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    sprite = Block((0, 0), [group])
+    refresh(group)
+    sprite.rect.topleft = (500, 500)
+    assert group.refresh_index() == 0
+    group.move(sprite)
+    assert group.refresh_index() == 1
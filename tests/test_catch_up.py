@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from constants import TILE_SIZE, OFFLINE_DAY_LENGTH
+from SoilLayer import SoilLayer, WATERED
+from savegame import CROP_COLUMNS, elapsed_days
+
+def plant_field(soil_layer, rng):
+    """Till every tile, plant some of them and water about half."""
+    rows, cols = soil_layer.grid.shape
+    for row in range(rows):
+        for col in range(cols):
+            pos = (col * TILE_SIZE, row * TILE_SIZE)
+            soil_layer.get_hit(pos)
+            if rng.random() < 0.6:
+                soil_layer.plant_seed(pos, 'corn' if rng.random() < 0.5 else 'tomato')
+            if rng.random() < 0.5:
+                soil_layer.water(pos)
+    crops = soil_layer.crops
+    crops.grow_speed[:len(crops)] = rng.choice([0.3, 0.5, 0.7, 1.0], len(crops))
+
+def rollover(soil_layer, raining):
+    """What Level.reset does to the soil: grow, dry out, then the new day's rain."""
+    soil_layer.update_plants()
+    soil_layer.remove_water()
+    soil_layer.raining = raining
+    if raining:
+        soil_layer.water_all()
+
+def field_state(soil_layer):
+    crops = soil_layer.crops
+    by_tile = {(int(crops.col[slot]), int(crops.row[slot])): (float(crops.age[slot]), bool(crops.harvestable[slot]))
+               for slot in range(len(crops))}
+    return soil_layer.grid.copy(), by_tile
+
+@pytest.mark.parametrize('days', [1, 2, 5, 40])
+def test_catch_up_matches_day_by_day(soil_layer, days):
+    rng = np.random.default_rng(days)
+    plant_field(soil_layer, rng)
+    rainy = rng.random(days) < 0.4
+
+    # Keep the starting field the way the save file would, then replay it day by day
+    crops = soil_layer.crops
+    grid = soil_layer.grid.copy()
+    columns = {name: getattr(crops, name)[:len(crops)].copy() for name in CROP_COLUMNS}
+    for raining in rainy:
+        rollover(soil_layer, bool(raining))
+    stepped_grid, stepped_crops = field_state(soil_layer)
+
+    # Rebuild the starting field in a second layer and catch it up in one call
+    fresh = SoilLayer(soil_layer.all_sprites, soil_layer.collision_sprites)
+    fresh.farmable = soil_layer.farmable
+    fresh.restore(grid, columns)
+    fresh.catch_up(days, rainy)
+
+    assert fresh.raining == bool(rainy[-1])
+    assert np.array_equal(fresh.grid, stepped_grid)
+    assert fresh.count(WATERED) == len(fresh.water_tiles)
+    caught_up = field_state(fresh)[1]
+    assert caught_up.keys() == stepped_crops.keys()
+    for tile, (age, harvestable) in stepped_crops.items():
+        assert caught_up[tile][0] == pytest.approx(age)
+        assert caught_up[tile][1] == harvestable
+
+def test_catch_up_of_no_days_changes_nothing(soil_layer):
+    plant_field(soil_layer, np.random.default_rng(0))
+    grid, crops = field_state(soil_layer)
+    soil_layer.catch_up(0, [])
+    assert np.array_equal(soil_layer.grid, grid)
+    assert field_state(soil_layer)[1] == crops
+
+def test_elapsed_days_counts_whole_real_days():
+    assert elapsed_days(0) == 0
+    assert elapsed_days(-60) == 0
+    assert elapsed_days(8 * 60 * 60) == 0  # A night away is not a game day
+    assert elapsed_days(OFFLINE_DAY_LENGTH) == 1
+    assert elapsed_days(OFFLINE_DAY_LENGTH * 3.5) == 3
@@ -0,0 +1,54 @@
+import pygame
+from constants import LAYERS, TILE_SIZE
+from chunks import ChunkBaker
+from tile_layer import TileLayer
+
+RED = (255, 0, 0, 255)
+BLUE = (0, 0, 255, 255)
+
+def filled(color, size=(TILE_SIZE, TILE_SIZE)):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+def pixel(chunk, pos):
+    return tuple(chunk.image.get_at((pos[0] - chunk.rect.x, pos[1] - chunk.rect.y)))
+
+def fence_baker():
+    group = pygame.sprite.Group()
+    baker = ChunkBaker(group)
+    fence = TileLayer(4, 4, [filled(RED)], LAYERS['main'])
+    fence[1, 1] = 1
+    baker.add_layer(fence)
+    baker.bake()
+    return baker, group
+
+def test_placed_surface_rebakes_its_chunk():
+    baker, group = fence_baker()
+    pos = (TILE_SIZE + 8, TILE_SIZE + 40)  # Sorts in front of the fence tile
+    baker.add_surface(pos, filled(BLUE, (16, 16)))
+    chunk = baker.chunk_at(pos, LAYERS['main'])
+    assert chunk.dirty
+
+    group.update(0)
+    assert not chunk.dirty
+    assert pixel(chunk, pos) == BLUE
+
+    assert baker.remove_tile(pos)
+    group.update(0)
+    assert pixel(chunk, pos) == RED
+
+def test_remove_grid_tile():
+    baker, group = fence_baker()
+    pos = (TILE_SIZE, TILE_SIZE)
+    chunk = baker.chunk_at(pos, LAYERS['main'])
+    assert pixel(chunk, pos) == RED
+
+    assert baker.remove_tile(pos)
+    assert not baker.remove_tile(pos)
+    group.update(0)
+    assert pixel(chunk, pos)[3] == 0
+
+def test_remove_tile_on_empty_chunk():
+    baker, _ = fence_baker()
+    assert not baker.remove_tile((3 * TILE_SIZE, 3 * TILE_SIZE))
@@ -0,0 +1,62 @@
+import numpy as np
+from crops import CropField
+
+class Crop:
+    """Stands in for the Plant sprite; CropField only keeps its slot up to date."""
+    slot = None
+
+def grow_one(crop, watered):
+    """One day of growth for one crop, as Plant.grow did it before CropField."""
+    if watered:
+        crop['age'] += crop['grow_speed']
+        if crop['age'] >= crop['max_age']:
+            crop['age'] = crop['max_age']
+            crop['harvestable'] = True
+
+def test_batched_growth_matches_per_plant_growth():
+    rng = np.random.default_rng(7)
+    field = CropField(capacity=4)  # Small, so reserve() has to grow it
+    crops = []  # (Crop, reference state) per planted crop
+    for day in range(30):
+        # Plant a few crops a day on free tiles of a 12 x 12 field
+        taken = {(int(field.col[slot]), int(field.row[slot])) for slot in range(len(field))}
+        for _ in range(3):
+            tile = (int(rng.integers(12)), int(rng.integers(12)))
+            if tile in taken:
+                continue
+            taken.add(tile)
+            crop = Crop()
+            speed = float(rng.choice([0.3, 0.5, 0.7, 1.0]))
+            crop.slot = field.add(crop, 'corn', tile, speed, max_age=3)
+            crops.append((crop, {'tile': tile, 'age': 0.0, 'grow_speed': speed, 'max_age': 3, 'harvestable': False}))
+
+        # Harvest one now and then, which moves the last crop into its slot
+        if crops and day % 4 == 3:
+            crop, _ = crops.pop(int(rng.integers(len(crops))))
+            field.remove(crop.slot)
+
+        water = rng.random((12, 12)) < 0.5
+        field.grow(water)
+        for crop, state in crops:
+            grow_one(state, water[state['tile'][1], state['tile'][0]])
+
+        assert len(field) == len(crops)
+        for crop, state in crops:
+            assert field.plants[crop.slot] is crop
+            assert (field.col[crop.slot], field.row[crop.slot]) == state['tile']
+            assert field.age[crop.slot] == state['age']
+            assert field.harvestable[crop.slot] == state['harvestable']
+
+def test_step_reports_only_stage_changes():
+    field = CropField()
+    slow, fast = Crop(), Crop()
+    slow.slot = field.add(slow, 'corn', (0, 0), 0.5, max_age=3)
+    fast.slot = field.add(fast, 'tomato', (1, 0), 1.0, max_age=3)
+    water = np.ones((1, 2), dtype=bool)
+
+    assert field.grow(water) == [fast]  # 0.5 stays on stage 0
+    assert set(field.grow(water)) == {slow, fast}
+    assert field.ripen(water) == [slow, fast]
+    assert field.harvestable[:2].all()
+    cols, rows = field.harvestable_tiles()
+    assert list(zip(cols, rows)) == [(0, 0), (1, 0)]
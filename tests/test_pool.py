@@ -0,0 +1,32 @@
+import pygame
+from constants import LAYERS
+from pool import SpritePool
+from sprites import Particle
+
+def test_particle_is_reused_and_fully_reset():
+    group = pygame.sprite.Group()
+    pool = SpritePool(Particle, [group])
+    small = pygame.Surface((8, 8), pygame.SRCALPHA)
+    small.fill((10, 20, 30, 255))
+    large = pygame.Surface((32, 16), pygame.SRCALPHA)
+    large.fill((10, 20, 30, 255))
+
+    first = pool.acquire(pos=(0, 0), surf=small, z=LAYERS['main'], duration=0)
+    first.start_time -= 1
+    first.update(0)
+    assert not first.alive() and pool.free == [first]
+
+    second = pool.acquire(pos=(100, 50), surf=large, z=LAYERS['fruit'], duration=300)
+    assert second is first and second in group
+    assert second.rect == pygame.Rect(100, 50, 32, 16)
+    assert second.image.get_size() == (32, 16)
+    assert second.z == LAYERS['fruit'] and second.duration == 300
+    assert (pool.created, pool.reused) == (1, 1)
+
+def test_pool_drops_sprites_past_max_size():
+    pool = SpritePool(Particle, [], max_size=1)
+    surf = pygame.Surface((4, 4))
+    sprites = [pool.acquire(pos=(0, 0), surf=surf, z=0) for _ in range(3)]
+    for sprite in sprites:
+        sprite.expire()
+    assert len(pool.free) == 1
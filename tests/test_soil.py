@@ -0,0 +1,72 @@
+from constants import TILE_SIZE
+from SoilLayer import TILLED, WATERED, PLANTED, RIPE
+
+def point(col, row):
+    """World-space center of a tile."""
+    return (col * TILE_SIZE + TILE_SIZE // 2, row * TILE_SIZE + TILE_SIZE // 2)
+
+def test_hoe_only_tills_farmable_tiles(soil_layer):
+    soil_layer.farmable[2, 1] = 0
+    soil_layer.get_hit(point(2, 1))
+    soil_layer.get_hit(point(3, 1))
+    assert soil_layer.grid[1, 2] == 0
+    assert soil_layer.grid[1, 3] == TILLED
+    assert set(soil_layer.soil_tiles) == {(3, 1)}
+
+def test_water_needs_tilled_soil(soil_layer):
+    soil_layer.water(point(4, 4))
+    assert soil_layer.grid[4, 4] == 0
+
+    soil_layer.get_hit(point(4, 4))
+    soil_layer.water(point(4, 4))
+    soil_layer.water(point(4, 4))
+    assert soil_layer.grid[4, 4] == TILLED | WATERED
+    assert soil_layer.check_watered(point(4, 4))
+    assert len(soil_layer.water_sprites) == 1
+
+def test_water_all_and_remove_water(soil_layer):
+    for col in range(3):
+        soil_layer.get_hit(point(col, 0))
+    soil_layer.water(point(0, 0))
+    soil_layer.water_all()
+    assert soil_layer.count(WATERED) == 3
+    assert len(soil_layer.water_tiles) == 3
+
+    soil_layer.remove_water()
+    assert soil_layer.count(WATERED) == 0
+    assert soil_layer.count(TILLED) == 3
+    assert not soil_layer.water_tiles and not soil_layer.water_sprites
+
+def test_plant_grow_and_harvest_flags(soil_layer):
+    assert not soil_layer.plant_seed(point(1, 1), 'corn')  # Not tilled yet
+
+    soil_layer.get_hit(point(1, 1))
+    assert soil_layer.plant_seed(point(1, 1), 'corn')
+    assert not soil_layer.plant_seed(point(1, 1), 'tomato')  # Already planted
+    assert soil_layer.grid[1, 1] == TILLED | PLANTED
+
+    soil_layer.water(point(1, 1))
+    soil_layer.maxAgeAllPlants()
+    assert soil_layer.grid[1, 1] == TILLED | WATERED | PLANTED | RIPE
+    assert soil_layer.harvestable_tiles() == [(1, 1)]
+
+    plant = soil_layer.plants[(1, 1)]
+    soil_layer.remove_plant(plant)
+    assert soil_layer.grid[1, 1] == TILLED | WATERED
+    assert not plant.alive() and not soil_layer.plants
+    assert len(soil_layer.crops) == 0
+
+def test_dry_plants_do_not_grow(soil_layer):
+    soil_layer.get_hit(point(5, 5))
+    soil_layer.plant_seed(point(5, 5), 'corn')
+    soil_layer.update_plants()
+    assert soil_layer.plants[(5, 5)].age == 0
+
+def test_points_off_the_grid_are_ignored(soil_layer):
+    rows, cols = soil_layer.grid.shape
+    soil_layer.grid[rows - 1, cols - 1] = TILLED | WATERED
+    for outside in [(-10, -10), (cols * TILE_SIZE + 5, 10), (10, rows * TILE_SIZE + 5)]:
+        soil_layer.get_hit(outside)
+        soil_layer.water(outside)
+        assert not soil_layer.check_watered(outside)
+    assert soil_layer.count(TILLED) == 1
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from constants import WEATHER_CHANCES
+from weather import WeatherSchedule, WEATHER_TYPES
+
+def test_same_seed_gives_same_weather_in_any_order():
+    ahead = WeatherSchedule(seed=7, block_size=5)
+    behind = WeatherSchedule(seed=7, block_size=5)
+    days = list(range(40))
+    forward = [ahead.weather_on(day) for day in days]
+    backward = [behind.weather_on(day) for day in reversed(days)][::-1]
+    assert forward == backward
+
+def test_day_zero_is_clear():
+    for seed in range(20):
+        assert WeatherSchedule(seed=seed).weather_on(0)[0] == 'clear'
+
+@pytest.mark.parametrize('start, days', [(0, 1), (3, 4), (4, 11), (17, 30)])
+def test_forecast_matches_single_days(start, days):
+    schedule = WeatherSchedule(seed=3, block_size=5)
+    kinds, intensities = schedule.forecast(start, days)
+    assert len(kinds) == len(intensities) == days
+    for offset, (kind, intensity) in enumerate(zip(kinds, intensities)):
+        assert schedule.weather_on(start + offset) == (WEATHER_TYPES[kind], float(intensity))
+    rainy = schedule.rainy(start, days)
+    assert list(rainy) == [schedule.weather_on(start + offset)[0] == 'rain' for offset in range(days)]
+
+def test_forecast_of_no_days_is_empty():
+    kinds, intensities = WeatherSchedule(seed=1).forecast(10, 0)
+    assert len(kinds) == len(intensities) == 0
+
+def test_forget_before_keeps_results():
+    schedule = WeatherSchedule(seed=11, block_size=5)
+    before = schedule.forecast(0, 30)
+    schedule.forget_before(20)
+    assert min(schedule.blocks) == 4
+    after = schedule.forecast(0, 30)
+    assert np.array_equal(before[0], after[0])
+    assert np.array_equal(before[1], after[1])
+
+def test_weather_follows_its_odds():
+    kinds, intensities = WeatherSchedule(seed=5).forecast(1, 20000)
+    for index, kind in enumerate(WEATHER_TYPES):
+        share = np.mean(kinds == index)
+        assert share == pytest.approx(WEATHER_CHANCES[kind] / sum(WEATHER_CHANCES.values()), abs=0.02)
+    assert 0.4 <= intensities.min() and intensities.max() < 1.0
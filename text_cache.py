@@ -0,0 +1,38 @@
+from collections import OrderedDict
+
+class TextCache:
+    """LRU cache of rendered text surfaces.
+
+    Surfaces are shared between callers and must not be drawn on.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same arguments as Font.render, plus the font to render with."""
+        key = (font, text, antialias, color, background)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color, background)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def report(self):
+        return f"text cache: {len(self.surfaces)} surfaces, {self.hits} hits, {self.misses} misses"
+
+# Shared by the menu, Pomodoro screens and editor
+text_cache = TextCache()
@@ -0,0 +1,50 @@
+import pygame
+from constants import TILE_SIZE
+from tile_grid import TileGrid
+
+# Collision tile kinds
+SOLID = 1  # Blocks the whole tile (the map's Collision layer)
+WALL = 2  # Blocks the same strip a Terrain hitbox would (fences, house walls)
+
+def tile_hitbox(col, row, value):
+    """World-space rect a blocking tile occupies."""
+    rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+    if value == WALL:
+        return rect.inflate(-TILE_SIZE * 0.2, -TILE_SIZE * 0.75)
+    return rect
+
+class TileBitmap:
+    """One byte per map tile, so a tile's flag is a single index lookup."""
+
+    def __init__(self, width, height, data=None):
+        self.grid = TileGrid(width, height, bytearray(width * height) if data is None else bytearray(data))
+
+    @classmethod
+    def from_layer(cls, layer, value=1):
+        """Mark every non-empty tile of a compiled tile layer with value."""
+        return cls(layer.width, layer.height, bytes(value if index else 0 for index in layer.data))
+
+    def __getitem__(self, tile):
+        return self.grid[tile]
+
+    def __setitem__(self, tile, value):
+        self.grid[tile] = value
+
+    def count(self):
+        return self.grid.count()
+
+    def value_at(self, point):
+        """Value of the tile under a world-space point."""
+        return self.grid[int(point[0]) // TILE_SIZE, int(point[1]) // TILE_SIZE]
+
+    def tiles_in(self, rect):
+        """(col, row, value) for every set tile a world-space rect overlaps."""
+        return self.grid.tiles_in(rect)
+
+    def hitboxes(self, rect):
+        """Hitboxes of the blocking tiles around rect."""
+        return [tile_hitbox(col, row, value) for col, row, value in self.grid.tiles_in(rect)]
+
+    def blocks(self, rect):
+        """True if rect overlaps any set tile."""
+        return bool(self.grid.tiles_in(rect))
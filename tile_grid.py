@@ -0,0 +1,49 @@
+from constants import TILE_SIZE
+
+class TileGrid:
+    """One value per map tile in a flat row-major buffer.
+
+    data can be any mutable sequence of ints (bytearray, array('H')).
+    Tiles outside the map read as 0.
+    """
+
+    def __init__(self, width, height, data):
+        self.width = width
+        self.height = height
+        self.data = data
+
+    def __getitem__(self, tile):
+        col, row = tile
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return self.data[row * self.width + col]
+        return 0
+
+    def __setitem__(self, tile, value):
+        col, row = tile
+        self.data[row * self.width + col] = value
+
+    def count(self):
+        """Number of tiles with a non-zero value."""
+        return len(self.data) - self.data.count(0)
+
+    def tiles(self):
+        """(col, row, value) for every non-zero tile."""
+        width = self.width
+        for index, value in enumerate(self.data):
+            if value:
+                yield index % width, index // width, value
+
+    def tiles_in(self, rect):
+        """(col, row, value) for every non-zero tile a world-space rect overlaps."""
+        left = max(rect.left // TILE_SIZE, 0)
+        top = max(rect.top // TILE_SIZE, 0)
+        right = min((rect.right - 1) // TILE_SIZE, self.width - 1)
+        bottom = min((rect.bottom - 1) // TILE_SIZE, self.height - 1)
+        tiles = []
+        for row in range(top, bottom + 1):
+            offset = row * self.width
+            for col in range(left, right + 1):
+                value = self.data[offset + col]
+                if value:
+                    tiles.append((col, row, value))
+        return tiles
@@ -0,0 +1,50 @@
+from array import array
+import pygame
+from constants import TILE_SIZE
+from tile_grid import TileGrid
+
+class TileLayer:
+    """One map layer as a flat row-major array of tile ids.
+
+    Id 0 is empty and id n draws surfaces[n - 1], a surface table shared with
+    the compiled map. Tiles of an animated layer all show the animation's
+    current frame instead. Tiles that draw on another z go in a layer of
+    their own (see Level.setup_house).
+    """
+
+    def __init__(self, width, height, surfaces, z, data=None, animation=None):
+        self.width = width
+        self.height = height
+        self.grid = TileGrid(width, height, array('H', bytes(width * height * 2)) if data is None else array('H', data))
+        self.surfaces = surfaces
+        self.z = z
+        self.animation = animation
+
+    @classmethod
+    def from_layer(cls, layer, z, animation=None):
+        """Copy the tile ids of a compiled tile layer."""
+        return cls(layer.width, layer.height, layer.images, z, layer.data, animation)
+
+    def __getitem__(self, tile):
+        return self.grid[tile]
+
+    def __setitem__(self, tile, value):
+        self.grid[tile] = value
+
+    def surface(self, tile, frame=0):
+        if self.animation:
+            return self.animation.frames[frame]
+        return self.surfaces[tile - 1]
+
+    def tiles(self):
+        """(col, row, tile) for every tile in the layer."""
+        return self.grid.tiles()
+
+    def tiles_in(self, rect):
+        """(col, row, tile) for every tile a world-space rect overlaps."""
+        return self.grid.tiles_in(rect)
+
+    def bounds(self):
+        """World-space rect around every tile in the layer, or None if it is empty."""
+        cells = [pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE) for col, row, _ in self.tiles()]
+        return cells[0].unionall(cells[1:]) if cells else None
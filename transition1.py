@@ -21,44 +21,47 @@ class Transition:
         self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.overlay.fill('black')  # The overlay color (black for now)
 
-    def play(self, dt):
+    def update(self, dt):
         """
-        Plays the transition effect. Handles fade-out and fade-in phases.
+        Advances the transition. Handles fade-out and fade-in phases.
         :param dt: Delta time for smooth transition scaling.
         """
         if not self.active:
             return
-        
+
         # Update the timer
         self.timer += dt
-        
-        # Calculate progress (0 to 1)
-        progress = self.timer / self.duration
-        progress = min(progress, 1)  # Cap progress at 1
-
-        if self.transition_phase == 'fade_out':
-            # Fade out: Increase opacity from 0 to 255
-            alpha = int(progress * 255)
-            self.overlay.set_alpha(alpha)
-            self.display_surface.blit(self.overlay, (0, 0))
 
-            if progress >= 1:  # If fade-out is complete
+        if self.progress() >= 1:
+            if self.transition_phase == 'fade_out':  # If fade-out is complete
                 self.reset_function()  # Call the reset function
                 self.timer = 0  # Reset the timer for the next phase
                 self.transition_phase = 'fade_in'
-        
-        elif self.transition_phase == 'fade_in':
-            # Fade in: Decrease opacity from 255 to 0
-            alpha = int((1 - progress) * 255)
-            self.overlay.set_alpha(alpha)
-            self.display_surface.blit(self.overlay, (0, 0))
 
-            if progress >= 1:  # If fade-in is complete
+            elif self.transition_phase == 'fade_in':  # If fade-in is complete
                 self.active = False  # End the transition
                 self.player.sleep = False  # Ensure the player is no longer "sleeping"
                 self.transition_phase = 'fade_out'  # Reset for the next transition
                 self.timer = 0  # Reset the timer for future transitions
 
+    def progress(self):
+        """Progress through the current phase (0 to 1)."""
+        return min(self.timer / self.duration, 1)
+
+    def draw(self):
+        """Draws the fade overlay for the current phase."""
+        if not self.active:
+            return
+
+        if self.transition_phase == 'fade_out':
+            # Fade out: Increase opacity from 0 to 255
+            alpha = int(self.progress() * 255)
+        else:
+            # Fade in: Decrease opacity from 255 to 0
+            alpha = int((1 - self.progress()) * 255)
+        self.overlay.set_alpha(alpha)
+        self.display_surface.blit(self.overlay, (0, 0))
+
     def start(self):
         """
         Activates the transition sequence, starting with fade-out.
@@ -1,74 +1,243 @@
+import os
+from itertools import repeat
+import numpy as np
 import pygame
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, LAYERS
-from support import import_folder
-from sprites import Terrain
-from random import randint, choice
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, DAY_LENGTH, WEATHER_CHANCES, FORECAST_DAYS
+from lighting import Lighting
+from assets import assets
 
 
 class Sky:
     def __init__(self, farm_screen):
         self.display_surface = farm_screen
-        self.full_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.start_color = [255, 255, 255]  # Start with a bright sky
-        self.end_color = (38, 101, 189)  # Night sky color
-        self.day = True  # Start with day mode
-
-    def display(self, dt):
-        """Gradually change the sky color for a day-night transition."""
-        for index, value in enumerate(self.end_color):
-            if self.day and self.start_color[index] > value:
-                # Transition from day to night
-                self.start_color[index] -= 2 * dt
-            elif not self.day and self.start_color[index] < 255:
-                # Transition from night to day
-                self.start_color[index] += 2 * dt
-
-        # Fill the screen with the transitioning color
-        self.full_surf.fill(self.start_color)
-        self.display_surface.blit(self.full_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-
-class Drop(Terrain):
-    def __init__(self, surf, pos, moving, groups, z):
-        super().__init__(pos, surf, groups, z)
-        self.lifetime = randint(400, 500)  # Lifetime in milliseconds
-        self.start_time = pygame.time.get_ticks()
-
-        self.moving = moving
-        if self.moving:
-            self.pos = pygame.math.Vector2(self.rect.topleft)
-            self.direction = pygame.math.Vector2(-1, 4)  # Slight horizontal drift, downward fall
-            self.speed = randint(100, 150)  # Speed for snowflakes
+        self.lighting = Lighting(farm_screen)
+        self.time_of_day = 0  # 0 is morning, wraps around at 1
+
+    def add_light(self, pos, radius):
+        self.lighting.add_light(pos, radius)
+
+    def start_day(self):
+        self.time_of_day = 0
+
+    def set_overcast(self, overcast):
+        self.lighting.set_overcast(overcast)
 
     def update(self, dt):
-        """Update the position and lifetime of the drop."""
-        if self.moving:
-            # Move the drop based on direction and speed
-            self.pos += self.direction * self.speed * dt
-            self.rect.topleft = (round(self.pos.x), round(self.pos.y))
-
-        # Remove the drop when its lifetime expires
-        if pygame.time.get_ticks() - self.start_time >= self.lifetime:
-            self.kill()
-
-
-class Snow:
-    def __init__(self, all_sprites):
-        self.all_sprites = all_sprites
-        self.snowflakes = import_folder("graphics/snow/flakes/")  # Load snowflake graphics
-        self.ground_w, self.ground_h = SCREEN_WIDTH, SCREEN_HEIGHT  # Full screen dimensions
-
-    def create_flake(self):
-        """Generate a snowflake at a random position."""
-        Drop(
-            surf=choice(self.snowflakes),  # Random snowflake image
-            pos=(randint(0, self.ground_w), randint(0, self.ground_h)),  # Random position
-            moving=True,
-            groups=self.all_sprites,
-            z=LAYERS["main"],
+        """Advance the time of day."""
+        self.time_of_day = (self.time_of_day + dt / DAY_LENGTH) % 1
+
+    def display(self, offset=(0, 0)):
+        """Tint the screen for the time of day."""
+        self.lighting.display(self.time_of_day, offset)
+
+
+class Stamp:
+    """A small particle image as pixel offsets, to draw thousands of copies with NumPy.
+
+    Blitting costs about a microsecond per call however small the image, so
+    a storm is drawn by writing each of the image's pixels for every particle
+    at once straight into the target's pixel buffer.
+    """
+
+    def __init__(self, image):
+        self.image = image
+        self.size = image.get_size()
+        alpha = pygame.surfarray.array_alpha(image)
+        rgb = pygame.surfarray.array3d(image)
+        self.pixels = [
+            ((int(x), int(y)), tuple(int(c) for c in rgb[x, y]), alpha[x, y] < 255)
+            for x, y in zip(*np.nonzero(alpha))
+        ]
+
+    @staticmethod
+    def supports(surface):
+        """Stamping needs a plain 32-bit surface (like the farm screen)."""
+        return surface.get_bitsize() == 32 and not surface.get_flags() & pygame.SRCALPHA
+
+    def draw(self, surface, positions):
+        """Stamp at every top-left (x, y) row of positions that fits on the surface."""
+        width, height = surface.get_size()
+        x, y = positions[:, 0], positions[:, 1]
+        fits = (x >= 0) & (y >= 0) & (x <= width - self.size[0]) & (y <= height - self.size[1])
+        pitch = surface.get_pitch() // 4
+        base = y[fits] * pitch + x[fits]
+
+        pixels = np.frombuffer(surface.get_buffer(), dtype=np.uint32)
+        for (dx, dy), color, translucent in self.pixels:
+            index = base + (dy * pitch + dx)
+            value = surface.map_rgb(color)
+            if translucent:
+                # Half-and-half blend without unpacking the channels
+                pixels[index] = ((pixels[index] & 0xFEFEFE) >> 1) + ((value & 0xFEFEFE) >> 1)
+            else:
+                pixels[index] = value
+        del pixels
+
+class ParticleSystem:
+    """Weather particles kept in NumPy arrays.
+
+    Every particle moves in one vectorized step and is drawn in one batch:
+    stamped into the pixel buffer, or with a single blits() call on surfaces
+    Stamp cannot write to. Positions are in world space; new particles appear
+    inside the camera's view. A particle with no life left is a free slot.
+    """
+
+    def __init__(self, images, capacity, rate, velocity, spread, lifetime):
+        self.images = images
+        self.stamps = [Stamp(image) for image in images]
+        self.rate = rate  # Particles spawned per second at full intensity
+        self.velocity = velocity  # Mean (x, y) speed in pixels per second
+        self.spread = spread  # Random +- added to each speed component
+        self.lifetime = lifetime  # (min, max) seconds
+        self.intensity = 0  # 0 (off) to 1 (full rate)
+        self.spawn_debt = 0
+        self.rng = np.random.default_rng()
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.image_index = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.life > 0))
+
+    def spawn(self, count, offset):
+        """Start up to count particles somewhere in the view."""
+        free = np.flatnonzero(self.life <= 0)[:count]
+        n = len(free)
+        if not n:
+            return
+        rng = self.rng
+        self.pos[free, 0] = offset[0] + rng.uniform(0, SCREEN_WIDTH, n)
+        self.pos[free, 1] = offset[1] + rng.uniform(0, SCREEN_HEIGHT, n)
+        self.vel[free] = self.velocity + rng.uniform(-1, 1, (n, 2)) * self.spread
+        self.life[free] = rng.uniform(*self.lifetime, n)
+        self.image_index[free] = rng.integers(0, len(self.images), n)
+
+    def update(self, dt, offset):
+        self.pos += self.vel * dt
+        self.life -= dt
+
+        self.spawn_debt += self.rate * self.intensity * dt
+        count = int(self.spawn_debt)
+        self.spawn_debt -= count
+        self.spawn(count, offset)
+
+    def draw(self, surface, offset):
+        alive = np.flatnonzero(self.life > 0)
+        if not len(alive):
+            return
+        positions = (self.pos[alive] - (offset[0], offset[1])).astype(np.int32)
+
+        if Stamp.supports(surface):
+            image_index = self.image_index[alive]
+            for index, stamp in enumerate(self.stamps):
+                stamp.draw(surface, positions[image_index == index] if len(self.stamps) > 1 else positions)
+            return
+
+        if len(self.images) == 1:
+            images = repeat(self.images[0])
+        else:
+            images = map(self.images.__getitem__, self.image_index[alive].tolist())
+        surface.blits(zip(images, positions.tolist()), doreturn=False)
+
+def weather_images(path, draw_fallback):
+    """Frames from an art folder if the game ships one, else drawn in code."""
+    if os.path.isdir(path):
+        return list(assets.frames(path))
+    return [draw_fallback()]
+
+def draw_raindrop():
+    surf = pygame.Surface((1, 10), pygame.SRCALPHA)
+    surf.fill((170, 200, 255, 150))
+    return surf
+
+def draw_snowflake():
+    surf = pygame.Surface((3, 3), pygame.SRCALPHA)
+    for pixel in ((1, 0), (0, 1), (1, 1), (2, 1), (1, 2)):
+        surf.set_at(pixel, (255, 255, 255, 255))
+    return surf
+
+class Weather:
+    """Rain and snow, drawn as their own layer above the sprites."""
+
+    def __init__(self, capacity=30000):
+        self.rain = ParticleSystem(
+            weather_images('graphics/rain/drops', draw_raindrop),
+            capacity, rate=3000, velocity=(-60, 900), spread=(10, 80), lifetime=(0.4, 0.8)
+        )
+        self.snow = ParticleSystem(
+            weather_images('graphics/snow/flakes', draw_snowflake),
+            capacity, rate=600, velocity=(-25, 100), spread=(25, 25), lifetime=(2.0, 4.0)
         )
+        self.systems = (self.rain, self.snow)
+
+    def set_rain(self, intensity):
+        self.rain.intensity = intensity
+
+    def set_snow(self, intensity):
+        self.snow.intensity = intensity
+
+    def update(self, dt, offset):
+        for system in self.systems:
+            if system.intensity or len(system):
+                system.update(dt, offset)
+
+    def draw(self, surface, offset):
+        for system in self.systems:
+            system.draw(surface, offset)
+
+    def report(self):
+        return f"weather: {len(self.rain)} rain, {len(self.snow)} snow particles"
+
+WEATHER_TYPES = tuple(WEATHER_CHANCES)
+
+class WeatherSchedule:
+    """Each day's weather and its intensity, drawn from seeded odds.
+
+    Days are generated FORECAST_DAYS at a time with one vectorized draw per
+    block, and a block depends only on the seed and its number, so any day
+    (past or future) always gets the same weather. Day 0 is always clear.
+    """
+
+    def __init__(self, seed=None, block_size=FORECAST_DAYS):
+        self.seed = int(np.random.SeedSequence().entropy % 2 ** 32) if seed is None else int(seed)
+        self.block_size = block_size
+        self.blocks = {}  # block number -> (kind indices, intensities)
+        self.chances = np.array([WEATHER_CHANCES[kind] for kind in WEATHER_TYPES])
+        self.chances /= self.chances.sum()
+
+    def block(self, number):
+        if number not in self.blocks:
+            rng = np.random.default_rng((self.seed, number))
+            kinds = rng.choice(len(WEATHER_TYPES), size=self.block_size, p=self.chances).astype(np.uint8)
+            intensities = rng.uniform(0.4, 1.0, self.block_size)
+            if number == 0:
+                kinds[0] = WEATHER_TYPES.index('clear')  # A new farm starts on a clear day
+            self.blocks[number] = kinds, intensities
+        return self.blocks[number]
+
+    def forecast(self, start, days):
+        """(kind indices, intensities) arrays for days start .. start + days - 1."""
+        if days <= 0:
+            return np.zeros(0, dtype=np.uint8), np.zeros(0)
+        first, last = start // self.block_size, (start + days - 1) // self.block_size
+        blocks = [self.block(number) for number in range(first, last + 1)]
+        begin = start - first * self.block_size
+        kinds = np.concatenate([kinds for kinds, _ in blocks])[begin:begin + days]
+        intensities = np.concatenate([intensities for _, intensities in blocks])[begin:begin + days]
+        return kinds, intensities
+
+    def weather_on(self, day):
+        """(kind, intensity) for one day, e.g. ('rain', 0.7)."""
+        kinds, intensities = self.forecast(day, 1)
+        return WEATHER_TYPES[kinds[0]], float(intensities[0])
+
+    def rainy(self, start, days):
+        """Boolean array: does it rain on each of the days from start on."""
+        return self.forecast(start, days)[0] == WEATHER_TYPES.index('rain')
 
-    def update(self):
-        """Continuously create snowflakes to simulate snowfall."""
-        for _ in range(5):  # Adjust number of snowflakes per frame for density
-            self.create_flake()
+    def forget_before(self, day):
+        """Drop blocks that only hold days before day."""
+        for number in [number for number in self.blocks if (number + 1) * self.block_size <= day]:
+            del self.blocks[number]